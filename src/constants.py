@@ -41,4 +41,5 @@ CARD_CONVERSION_EPIC = 10
 
 # File paths
 CARDS_DATA_PATH = "data/cards.json"
-PLAYER_DATA_PATH = "data/player_data.json"
\ No newline at end of file
+PLAYER_DATA_PATH = "data/player_data.json"
+SHOP_ITEMS_PATH = "data/shop_items.json"
\ No newline at end of file
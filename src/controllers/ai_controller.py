@@ -173,7 +173,7 @@ class AIController:
             
             for pos, (position, score) in enumerate(field_positions):
                 # Skip positions that are already filled
-                if ai_player.field[position] is not None:
+                if not ai_player.is_slot_free(position):
                     continue
                 
                 # Calculate how good this card would be in this position
@@ -220,13 +220,10 @@ class AIController:
         """
         position_scores = []
         
-        for position in range(PLAYER_FIELD_SIZE):
+        # Only empty positions are candidates
+        for position in ai_player.free_slots():
             score = 0
             
-            # Check if the position is already occupied
-            if ai_player.field[position] is not None:
-                continue
-            
             # Check what's in the opposing position
             opposing_card = human_player.field[position]
             
@@ -356,7 +353,7 @@ class AIController:
             situational_score += balance * 2.0 * self.weights["board_control"]
         
         # Board state analysis
-        empty_slots = sum(1 for slot in ai_player.field if slot is None)
+        empty_slots = ai_player.free_slot_count()
         
         # If few slots remain, prioritize impactful cards
         if empty_slots <= 1:
@@ -46,7 +46,7 @@ class GameController:
             player.reset_energy()
             player.health = player.max_health
             player.hand.clear()
-            player.field = [None] * len(player.field)
+            player.clear_field()
             
             # Shuffle decks
             player.deck.shuffle()
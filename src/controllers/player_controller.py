@@ -55,7 +55,7 @@ class PlayerController:
             return False, "Invalid field index"
         
         # Check if the field position is occupied
-        if player.field[field_index] is not None:
+        if not player.is_slot_free(field_index):
             return False, "Field position already occupied"
         
         # Check energy
@@ -6,6 +6,12 @@ from typing import List, Optional, Dict, Tuple
 from collections import Counter
 from .card import Card
 
+
+# Rarity order used for deck statistics
+_RARITIES = ("common", "uncommon", "rare", "epic")
+_RARITY_INDEX = {rarity: index for index, rarity in enumerate(_RARITIES)}
+
+
 class Deck:
     """
     Represents a deck of cards in the game.
@@ -13,6 +19,8 @@ class Deck:
     Attributes:
         cards (List[Card]): List of cards in the deck
         name (str): Name of the deck
+        version (int): Incremented whenever the cards change, through the deck
+            methods or by assigning ``cards``
     """
     
     MAX_DECK_SIZE = 30
@@ -27,7 +35,22 @@ class Deck:
             cards (List[Card], optional): Initial list of cards. Defaults to None.
         """
         self.name = name
-        self.cards = cards if cards is not None else []
+        self._cards = cards if cards is not None else []
+        self.version = 0
+        
+        # validate() and get_stats() results with the version they were built for
+        self._validate_cache = None
+        self._stats_cache = None
+    
+    @property
+    def cards(self) -> List[Card]:
+        """Cards in the deck, top first."""
+        return self._cards
+    
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        self._cards = cards
+        self.version += 1
     
     def add_card(self, card: Card) -> bool:
         """
@@ -49,6 +72,7 @@ class Deck:
             return False
         
         self.cards.append(card)
+        self.version += 1
         return True
     
     def remove_card(self, card_index: int) -> Optional[Card]:
@@ -62,14 +86,25 @@ class Deck:
             Optional[Card]: Removed card or None if index is invalid
         """
         if 0 <= card_index < len(self.cards):
+            self.version += 1
             return self.cards.pop(card_index)
         return None
     
-    def shuffle(self) -> None:
+    def clear(self) -> None:
+        """Remove all cards from the deck."""
+        self.cards = []
+    
+    def shuffle(self, rng: Optional[random.Random] = None) -> None:
         """
-        Shuffle the deck.
+        Shuffle the deck in place.
+        
+        Args:
+            rng (random.Random, optional): Generator to shuffle with, so bulk
+                simulations can use their own (seeded) instance. Defaults to
+                the shared module-level generator.
         """
-        random.shuffle(self.cards)
+        (rng or random).shuffle(self.cards)
+        self.version += 1
     
     def draw(self) -> Optional[Card]:
         """
@@ -80,6 +115,7 @@ class Deck:
         """
         if not self.cards:
             return None
+        self.version += 1
         return self.cards.pop(0)
     
     def draw_hand(self, count: int) -> List[Card]:
@@ -92,11 +128,10 @@ class Deck:
         Returns:
             List[Card]: List of drawn cards
         """
-        hand = []
-        for _ in range(min(count, len(self.cards))):
-            card = self.draw()
-            if card:
-                hand.append(card)
+        count = max(0, count)
+        hand = self.cards[:count]
+        del self.cards[:count]
+        self.version += 1
         return hand
     
     def is_empty(self) -> bool:
@@ -124,6 +159,17 @@ class Deck:
         Returns:
             Tuple[bool, str]: (is_valid, message) 
         """
+        key = self.version
+        cached = self._validate_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        result = self._validate()
+        self._validate_cache = (key, result)
+        return result
+    
+    def _validate(self) -> Tuple[bool, str]:
+        """Check the deck against game rules without using the cache."""
         # Check deck size
         if len(self.cards) < 1:
             return False, "Deck must contain at least 1 card"
@@ -152,11 +198,26 @@ class Deck:
         """
         Get statistics about the deck.
         
+        The returned dictionary is cached until the deck changes, so callers
+        should not modify it.
+        
         Returns:
             Dict[str, any]: Deck statistics including rarity distribution, cost curve, etc.
         """
+        key = self.version
+        cached = self._stats_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        stats = self._compute_stats()
+        self._stats_cache = (key, stats)
+        return stats
+    
+    def _compute_stats(self) -> Dict[str, any]:
+        """Work out the deck statistics without using the cache."""
         stats = {
             "size": len(self.cards),
+            "total_cost": 0,
             "rarity_distribution": {},
             "cost_distribution": {},
             "attack_distribution": {},
@@ -164,8 +225,8 @@ class Deck:
         }
         
         # Initialize distributions
-        for rarity in ["common", "uncommon", "rare", "epic"]:
-            stats["rarity_distribution"][rarity] = 0
+        rarity_counts = [0] * len(_RARITIES)
+        rarity_index = _RARITY_INDEX.get
         
         for cost in range(0, 4):  # 0-3 cost
             stats["cost_distribution"][cost] = 0
@@ -173,10 +234,12 @@ class Deck:
         # Calculate distributions
         for card in self.cards:
             # Rarity distribution
-            if card.rarity in stats["rarity_distribution"]:
-                stats["rarity_distribution"][card.rarity] += 1
+            index = rarity_index(card.rarity)
+            if index is not None:
+                rarity_counts[index] += 1
             
-            # Cost distribution
+            # Cost total and distribution
+            stats["total_cost"] += card.cost
             if card.cost in stats["cost_distribution"]:
                 stats["cost_distribution"][card.cost] += 1
             
@@ -184,6 +247,8 @@ class Deck:
             stats["attack_distribution"][card.attack] = stats["attack_distribution"].get(card.attack, 0) + 1
             stats["health_distribution"][card.hp] = stats["health_distribution"].get(card.hp, 0) + 1
         
+        stats["rarity_distribution"] = dict(zip(_RARITIES, rarity_counts))
+        
         return stats
     
     def to_dict(self) -> dict:
@@ -233,25 +298,15 @@ class Deck:
         """
         # This is a simplified implementation - in a real game, you'd have
         # a more sophisticated algorithm for creating a balanced starter deck
+        common_cards = [card for card in card_database.values() if card.rarity == "common"]
+        uncommon_cards = [card for card in card_database.values() if card.rarity == "uncommon"]
         
-        # Filter cards by rarity for starter deck
-        common_cards = [card for card in card_database.values() 
-                        if card.rarity == "common"]
-        uncommon_cards = [card for card in card_database.values() 
-                         if card.rarity == "uncommon"]
-        
-        # Create a simple 30-card deck with 70% common and 30% uncommon cards
+        # 70% common and 30% uncommon cards
         starter_cards = []
-        
-        # Add common cards
         if common_cards:
-            for _ in range(21):  # 70% common
-                starter_cards.append(random.choice(common_cards))
-        
-        # Add uncommon cards
+            starter_cards += random.choices(common_cards, k=21)
         if uncommon_cards:
-            for _ in range(9):  # 30% uncommon
-                starter_cards.append(random.choice(uncommon_cards))
+            starter_cards += random.choices(uncommon_cards, k=9)
         
         starter_deck = cls(name="Starter Deck", cards=starter_cards)
         starter_deck.shuffle()
@@ -46,6 +46,7 @@ class Player:
         self.deck = deck
         self.hand = []
         self.field = [None] * PLAYER_FIELD_SIZE  # Initialize empty field slots
+        self._field_occupied = 0  # Bit i set when field slot i holds a card
         self.collection = {}  # Card ID -> quantity
         self.credits = 0
     
@@ -94,7 +95,7 @@ class Player:
             return False, "Invalid field index"
         
         # Check if the field position is occupied
-        if self.field[field_index] is not None:
+        if self._field_occupied & (1 << field_index):
             return False, "Field position already occupied"
         
         # Get the card and check if we have enough energy
@@ -104,10 +105,59 @@ class Player:
         
         # Play the card
         self.energy -= card.cost
-        self.field[field_index] = self.hand.pop(hand_index)
+        self._place_on_field(field_index, self.hand.pop(hand_index))
         
         return True, "Card played successfully"
     
+    def _place_on_field(self, field_index: int, card: Card) -> None:
+        """
+        Put a card in a field position, keeping the occupancy mask in step.
+        
+        Args:
+            field_index (int): Index of the field position
+            card (Card): Card to place
+        """
+        self.field[field_index] = card
+        self._field_occupied |= 1 << field_index
+    
+    def clear_field(self) -> None:
+        """
+        Remove all cards from the field.
+        """
+        self.field = [None] * PLAYER_FIELD_SIZE
+        self._field_occupied = 0
+    
+    def is_slot_free(self, field_index: int) -> bool:
+        """
+        Check if a field position is empty.
+        
+        Args:
+            field_index (int): Index of the field position
+            
+        Returns:
+            bool: True if no card occupies the position, False otherwise
+        """
+        return not self._field_occupied & (1 << field_index)
+    
+    def free_slots(self) -> List[int]:
+        """
+        Get the empty field positions.
+        
+        Returns:
+            List[int]: Indices of empty field positions, in order
+        """
+        occupied = self._field_occupied
+        return [i for i in range(PLAYER_FIELD_SIZE) if not occupied & (1 << i)]
+    
+    def free_slot_count(self) -> int:
+        """
+        Get the number of empty field positions.
+        
+        Returns:
+            int: Number of empty field positions
+        """
+        return PLAYER_FIELD_SIZE - self._field_occupied.bit_count()
+    
     def take_damage(self, damage: int) -> None:
         """
         Apply damage to the player.
@@ -287,7 +337,7 @@ class PlayerController:
             return False, "Invalid field index"
         
         # Check if the field position is occupied
-        if player.field[field_index] is not None:
+        if not player.is_slot_free(field_index):
             return False, "Field position already occupied"
         
         # Check energy
@@ -308,10 +358,8 @@ class PlayerController:
         }
         
         if success:
-            # Now actually play the card
-            card = player.hand[hand_index]
-            player.energy -= card.cost
-            player.field[field_index] = player.hand.pop(hand_index)
+            # Now actually play the card; Player keeps its field bookkeeping
+            player.play_card(hand_index, field_index)
             
             # Record the event
             result["events"].append({
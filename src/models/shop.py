@@ -1,14 +1,43 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
 import random
 import json
 import os
 import time
-from datetime import datetime, timedelta
+
+try:
+    # Optional faster parser; both accept the raw bytes read from disk
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from src.models.player_economy import PlayerEconomy
+from src.constants import CARDS_DATA_PATH, SHOP_ITEMS_PATH
+
+# Pack artwork, pack_1.png to pack_6.png
+PACK_IMAGES = tuple(f"data/assets/gui/pack_{i}.png" for i in range(1, 7))
+
+# Seconds between automatic inventory refreshes
+_REFRESH_INTERVAL_S = 24 * 60 * 60
+
+# Parsed JSON files keyed by path, with the mtime they were parsed at
+_JSON_CACHE: Dict[str, Tuple[int, Any]] = {}
 
-@dataclass
+
+def _cached_json(file_path: str) -> Any:
+    """Load a JSON file, reusing the parsed data while the file is unchanged."""
+    mtime = os.stat(file_path).st_mtime_ns
+    cached = _JSON_CACHE.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(file_path, 'rb') as f:
+        data = _json_loads(f.read())
+    _JSON_CACHE[file_path] = (mtime, data)
+    return data
+
+@dataclass(slots=True)
 class ShopItem:
     """Item for sale in the shop."""
     id: str
@@ -22,150 +51,182 @@ class ShopItem:
     def can_afford(self, economy: PlayerEconomy) -> bool:
         """Check if player can afford this item."""
         return economy.coins >= self.price_coins
+    
+    def to_dict(self) -> dict:
+        """Convert the item to a JSON-serializable dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class ShopManager:
     """Manages the shop and its inventory."""
     
     def __init__(self):
-        self.all_items: Dict[str, ShopItem] = {}
-        self.current_inventory: List[ShopItem] = []
-        self.last_refresh = datetime.now() - timedelta(days=1)  # Force refresh on start
+        # Card data and shop items are loaded lazily on first access
         self.last_pack_purchase_time = 0  # Track time of last pack purchase
-        self.card_data = {}  # Will store cards from cards.json
-        self.cards_by_rarity = {
+        
+        # Items on sale and their index by id, stocked by the first refresh;
+        # _last_refresh_s stays None until then
+        self._last_refresh_s = None
+        self._inventory: List[ShopItem] = []
+        self._inventory_by_id: Dict[str, ShopItem] = {}
+    
+    @cached_property
+    def card_data(self) -> Dict[str, dict]:
+        """Cards from cards.json, loaded on first access."""
+        return self._load_card_data()
+    
+    @cached_property
+    def cards_by_rarity(self) -> Dict[str, List[str]]:
+        """Card ids grouped by rarity, built on first access."""
+        cards_by_rarity = {
             "common": [],
             "uncommon": [],
             "rare": [],
             "epic": []
         }
-        self._load_card_data()
-        self._load_shop_items()
+        
+        # Organize cards by rarity, ignoring unknown rarities
+        appenders = {rarity: cards.append for rarity, cards in cards_by_rarity.items()}
+        get_appender = appenders.get
+        for card_id, card_info in self.card_data.items():
+            append = get_appender(card_info.get("rarity", "common"))
+            if append is not None:
+                append(card_id)
+        
+        for rarity, cards in cards_by_rarity.items():
+            print(f"  {rarity}: {len(cards)} cards")
+        return cards_by_rarity
+    
+    @cached_property
+    def _rarity_buckets(self) -> Tuple[Tuple[str, ...], ...]:
+        """Frozen (common, uncommon, rare, epic) buckets for pack generation."""
+        by_rarity = self.cards_by_rarity
+        return (
+            tuple(by_rarity["common"]),
+            tuple(by_rarity["uncommon"]),
+            tuple(by_rarity["rare"]),
+            tuple(by_rarity["epic"]),
+        )
+    
+    @cached_property
+    def all_items(self) -> Dict[str, ShopItem]:
+        """All potential shop items, loaded on first access."""
+        return self._load_shop_items()
     
-    def _load_card_data(self):
+    @cached_property
+    def _pack_items(self) -> List[ShopItem]:
+        """Pack items from all_items; membership never changes after load."""
+        return [item for item in self.all_items.values() if item.item_type == "pack"]
+    
+    @property
+    def current_inventory(self) -> List[ShopItem]:
+        """Items on sale, stocked by the first refresh when first read."""
+        if self._last_refresh_s is None:
+            self.refresh_inventory()
+        return self._inventory
+    
+    @property
+    def _by_id(self) -> Dict[str, ShopItem]:
+        """Index of current_inventory by item id."""
+        if self._last_refresh_s is None:
+            self.refresh_inventory()
+        return self._inventory_by_id
+    
+    def _load_card_data(self) -> Dict[str, dict]:
         """Load all card data from cards.json"""
         try:
-            file_path = os.path.join("data", "cards.json")
+            file_path = CARDS_DATA_PATH
             if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    self.card_data = json.load(f)
-                    
-                # Organize cards by rarity
-                for card_id, card_info in self.card_data.items():
-                    rarity = card_info.get("rarity", "common")
-                    if rarity in self.cards_by_rarity:
-                        self.cards_by_rarity[rarity].append(card_id)
-                        
-                print(f"Loaded {len(self.card_data)} cards from cards.json")
-                for rarity, cards in self.cards_by_rarity.items():
-                    print(f"  {rarity}: {len(cards)} cards")
-            else:
-                print("Warning: cards.json not found!")
+                card_data = _cached_json(file_path)
+                print(f"Loaded {len(card_data)} cards from cards.json")
+                return card_data
+            print("Warning: cards.json not found!")
         except Exception as e:
             print(f"Error loading card data: {e}")
+        return {}
     
-    def _load_shop_items(self):
+    def _load_shop_items(self) -> Dict[str, ShopItem]:
         """Load all potential shop items from file."""
+        items = {}
         try:
-            file_path = os.path.join("data", "shop_items.json")
+            file_path = SHOP_ITEMS_PATH
             if not os.path.exists(file_path):
-                self._create_default_shop_items()
-                return
-            
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                for item_data in data:
-                    item = ShopItem(
-                        id=item_data.get("id"),
-                        name=item_data.get("name"),
-                        description=item_data.get("description"),
-                        image=item_data.get("image"),
-                        price_coins=item_data.get("price_coins", 0),
-                        item_type=item_data.get("item_type", "card"),
-                        rarity=item_data.get("rarity", "common")
-                    )
-                    self.all_items[item.id] = item
+                return self._create_default_shop_items()
             
-            self.refresh_inventory()
+            data = _cached_json(file_path)
+            for item_data in data:
+                item = ShopItem(
+                    id=item_data.get("id"),
+                    name=item_data.get("name"),
+                    description=item_data.get("description"),
+                    image=item_data.get("image"),
+                    price_coins=item_data.get("price_coins", 0),
+                    item_type=item_data.get("item_type", "card"),
+                    rarity=item_data.get("rarity", "common")
+                )
+                items[item.id] = item
         except Exception as e:
             print(f"Error loading shop items: {e}")
-            self._create_default_shop_items()
+            items.update(self._create_default_shop_items())
+        return items
     
-    def _create_default_shop_items(self):
+    def _create_default_shop_items(self) -> Dict[str, ShopItem]:
         """Create and save default shop items."""
         # Generate three identical packs but with different IDs
         default_items = []
         
         for i in range(3):
-            # Random pack image from pack_1.png to pack_6.png
-            random_pack_num = random.randint(1, 6)
-            pack_image = f"data/assets/gui/pack_{random_pack_num}.png"
-            
             default_items.append(ShopItem(
                 id=f"pack_{i+1}",
                 name="Card Pack",
                 description="Contains 5 cards of random rarities",
-                image=pack_image,
+                image=random.choice(PACK_IMAGES),
                 price_coins=30,  # All packs cost 30 credits
                 item_type="pack",
                 rarity="common"
             ))
         
-        for item in default_items:
-            self.all_items[item.id] = item
-        
         try:
-            os.makedirs("data", exist_ok=True)
-            with open(os.path.join("data", "shop_items.json"), 'w') as f:
-                json.dump([{
-                    "id": item.id,
-                    "name": item.name,
-                    "description": item.description,
-                    "image": item.image,
-                    "price_coins": item.price_coins,
-                    "item_type": item.item_type,
-                    "rarity": item.rarity
-                } for item in default_items], f)
-            
-            self.refresh_inventory()
+            os.makedirs(os.path.dirname(SHOP_ITEMS_PATH), exist_ok=True)
+            with open(SHOP_ITEMS_PATH, 'w') as f:
+                json.dump([item.to_dict() for item in default_items], f)
         except Exception as e:
             print(f"Error saving default shop items: {e}")
+        
+        return {item.id: item for item in default_items}
     
     def refresh_inventory(self) -> bool:
         """Refresh the shop inventory. Returns True if refreshed."""
-        now = datetime.now()
+        now = time.monotonic()
         
-        # Only refresh once per day (or if forced)
-        if (now - self.last_refresh).days < 1:
+        # Only refresh once per day, always stocking the shop the first time
+        if self._last_refresh_s is not None and now - self._last_refresh_s < _REFRESH_INTERVAL_S:
             return False
         
-        self.last_refresh = now
+        self._last_refresh_s = now
         
         # Update pack images with random ones
-        for item in self.all_items.values():
-            if item.item_type == "pack":
-                random_pack_num = random.randint(1, 6)
-                item.image = f"data/assets/gui/pack_{random_pack_num}.png"
+        choice = random.choice
+        for item in self._pack_items:
+            item.image = choice(PACK_IMAGES)
         
         # Just select all packs for the inventory
-        self.current_inventory = [item for item in self.all_items.values() if item.item_type == "pack"]
+        self._inventory = list(self._pack_items)
+        self._inventory_by_id = {item.id: item for item in self._inventory}
         
         return True
     
     def _refresh_pack(self, pack_id: str) -> None:
         """Refresh a specific pack after purchase."""
-        # Find the pack in inventory
-        for i, item in enumerate(self.current_inventory):
-            if item.id == pack_id:
-                # Choose a new random pack image
-                random_pack_num = random.randint(1, 6)
-                item.image = f"data/assets/gui/pack_{random_pack_num}.png"
-                return
+        item = self._by_id.get(pack_id)
+        if item is not None:
+            # Choose a new random pack image
+            item.image = random.choice(PACK_IMAGES)
     
     def purchase_item(self, item_id: str, economy: PlayerEconomy) -> Dict:
         """Process a purchase. Returns result information."""
         # Find the item in current inventory
-        item = next((i for i in self.current_inventory if i.id == item_id), None)
+        item = self._by_id.get(item_id)
         
         if not item:
             return {"success": False, "message": "Item not found in shop"}
@@ -199,37 +260,28 @@ class ShopManager:
             "cards": cards
         }
     
-    def _generate_pack_contents(self) -> List[str]:
+    def _generate_pack_contents(self, count: int = 5) -> List[str]:
         """Generate contents for a card pack using rarity probabilities."""
-        cards = []
-        
         # Check if we have card data
         if not self.card_data:
             print("Warning: No card data available for pack generation")
-            return cards
+            return []
         
-        # Generate 5 cards with probability distribution
-        for _ in range(5):
-            rng = random.random() * 100
-            
-            if rng < 55 and self.cards_by_rarity["common"]:  # 55% common
-                card_id = random.choice(self.cards_by_rarity["common"])
-            elif rng < 80 and self.cards_by_rarity["uncommon"]:  # 25% uncommon
-                card_id = random.choice(self.cards_by_rarity["uncommon"])
-            elif rng < 95 and self.cards_by_rarity["rare"]:  # 15% rare
-                card_id = random.choice(self.cards_by_rarity["rare"])
-            elif self.cards_by_rarity["epic"]:  # 5% epic
-                card_id = random.choice(self.cards_by_rarity["epic"])
-            elif self.cards_by_rarity["rare"]:  # Fallback if no epic cards
-                card_id = random.choice(self.cards_by_rarity["rare"])
-            elif self.cards_by_rarity["uncommon"]:  # Fallback if no rare cards
-                card_id = random.choice(self.cards_by_rarity["uncommon"])
-            elif self.cards_by_rarity["common"]:  # Fallback if no uncommon cards
-                card_id = random.choice(self.cards_by_rarity["common"])
-            else:
-                print("Warning: No cards found for pack generation")
-                continue
-                
-            cards.append(card_id)
-        
-        return cards
\ No newline at end of file
+        # Bucket per rarity roll (common, uncommon, rare, epic), falling back
+        # to the next available rarity when a bucket is empty
+        common, uncommon, rare, epic = self._rarity_buckets
+        buckets = (
+            common or uncommon or rare or epic,
+            uncommon or rare or epic or common,
+            rare or epic or uncommon or common,
+            epic or rare or uncommon or common,
+        )
+        if not buckets[0]:
+            print("Warning: No cards found for pack generation")
+            return []
+        
+        # Roll every rarity for the pack in one call:
+        # 55% common, 25% uncommon, 15% rare, 5% epic
+        rolls = random.choices(range(4), cum_weights=(55, 80, 95, 100), k=count)
+        choice = random.choice
+        return [choice(buckets[roll]) for roll in rolls]
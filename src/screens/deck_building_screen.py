@@ -3,6 +3,9 @@ Enhanced deck building screen for the card game.
 """
 import pygame
 import os
+from collections import Counter
+from functools import partial
+from operator import itemgetter
 from typing import List, Dict, Tuple, Optional
 
 # Fixed imports
@@ -13,6 +16,41 @@ from src.models.card import Card
 from src.utils.resource_loader import ResourceLoader
 from src.utils.save_manager import SaveManager
 
+# Button fonts shared by every deck builder button, keyed by size
+_BUTTON_FONTS = {}
+
+
+def _button_font(size):
+    """Get the shared button font for a size, loading it on first use."""
+    font = _BUTTON_FONTS.get(size)
+    if font is None:
+        font = pygame.freetype.SysFont('Arial', size)
+        _BUTTON_FONTS[size] = font
+    return font
+
+
+# (text, value) for each button in the collection filter and sort rows
+_RARITY_FILTER_BUTTONS = (
+    ("All", "all"),
+    ("Common", "common"),
+    ("Uncommon", "uncommon"),
+    ("Rare", "rare"),
+    ("Epic", "epic"),
+)
+_COST_FILTER_BUTTONS = (("All", "all"), ("0", 0), ("1", 1), ("2", 2), ("3", 3))
+_SORT_BUTTONS = (("Name", "name"), ("Cost", "cost"), ("Rarity", "rarity"))
+
+# Sort position of each rarity, lowest first
+_RARITY_ORDER = {"common": 0, "uncommon": 1, "rare": 2, "epic": 3}
+
+# Collection entries are (name, cost, rarity order, card, quantity) tuples;
+# these pick the precomputed sort key for each sort method
+_SORT_KEYS = {
+    "name": itemgetter(0),
+    "cost": itemgetter(1),
+    "rarity": itemgetter(2),
+}
+
 
 class DeckBuildingScreen(Screen):
     """
@@ -40,6 +78,9 @@ class DeckBuildingScreen(Screen):
         self.player = None
         self.current_deck = None
         
+        # Copies of each card id in the current deck
+        self._deck_id_counts = Counter()
+        
         # Collection view state
         self.collection_page = 0
         self.cards_per_page = 8
@@ -48,6 +89,23 @@ class DeckBuildingScreen(Screen):
         self.sort_method = "name"  # name, cost, rarity
         self.selected_collection_card = None
         
+        # Filtered collection cache, keyed by (rarity filter, cost filter,
+        # sort method, collection version), and its page count
+        self._filtered_cache = None
+        self._filtered_cache_key = None
+        self._filtered_page_count = 1
+        
+        # Bumped whenever the collection view is rebuilt
+        self._collection_version = 0
+        
+        # Owned card entries grouped by rarity, plus an "all" bucket,
+        # and their sorted copies keyed by (rarity filter, sort method)
+        self._cards_by_rarity = {}
+        self._sorted_variants = {}
+        
+        # Total number of owned cards, counting duplicates
+        self._collection_total = 0
+        
         # Deck view state
         self.deck_page = 0
         self.selected_deck_card = None
@@ -57,16 +115,59 @@ class DeckBuildingScreen(Screen):
         self.deck_list_panel = None
         self.showing_deck_list = False
         
+        # (deck names, active deck name) the deck list panel was built for
+        self._deck_list_key = None
+        
+        # Cards shown on the current collection and deck pages, set by _update_ui
+        self._current_page_cards = []
+        self._current_deck_page_cards = []
+        
+        # Open deck name dialog parts; None while it is closed
+        self.deck_name_dialog = None
+        self.dialog_overlay = None
+        self.name_label = None
+        self.deck_name_input_border = None
+        self.deck_name_input = ""
+        self.rename_old_name = None  # None when creating a new deck
+        
+        # Set when typed keys changed the deck name since the last update
+        self._name_label_stale = False
+        
         # Status message
         self.status_message = ""
         self.status_message_color = (180, 180, 180)
         self.status_message_timer = 0
+        self.status_bg = None
+        
+        # Card renderer; keeps art for the visible pages plus the next ones
+        self.card_renderer = CardRenderer(card_size=(100, 150), max_images=48)
+        
+        # Fonts for the card overlays, and rendered badge text keyed by string
+        self._qty_font = pygame.freetype.SysFont('Arial', 14)
+        self._hint_font = pygame.freetype.SysFont('Arial', 10)
+        self._qty_surf_cache = {}
+        
+        # Rounded badge background shared by every quantity/count indicator
+        self._qty_badge = pygame.Surface((20, 20), pygame.SRCALPHA)
+        badge_rect = self._qty_badge.get_rect()
+        pygame.draw.rect(self._qty_badge, (50, 50, 70), badge_rect, border_radius=10)
+        pygame.draw.rect(self._qty_badge, (100, 100, 130), badge_rect, width=1, border_radius=10)
         
-        # Card renderer
-        self.card_renderer = CardRenderer(card_size=(100, 150))
+        # Card hints, each rendered once: "Click to add" on its own
+        # semi-transparent background, and the plain "Click to remove" text
+        self._add_hint = self._create_add_hint()
+        self._remove_hint = self._hint_font.render("Click to remove", (180, 180, 180))[0]
         
         # Create UI elements
         self._create_ui_elements()
+        
+        # Card slot rectangles for each page position; the layout is fixed
+        self._collection_slot_rects = [
+            self._get_collection_card_rect(i) for i in range(self.cards_per_page)
+        ]
+        self._deck_slot_rects = [
+            self._get_deck_card_rect(i) for i in range(self.cards_per_page)
+        ]
     
     def _create_ui_elements(self):
         """Create the UI elements for the deck building screen."""
@@ -135,61 +236,16 @@ class DeckBuildingScreen(Screen):
         button_spacing = (panel_width - button_width * 5) // 4  # Distribute remaining space
         button_y = 50
         
-        # Calculate positions based on available width
-        button_positions = []
-        for i in range(5):
-            x_pos = 100 + i * (button_width + button_spacing)
-            button_positions.append(x_pos)
-        
-        all_button = Button(
-            pygame.Rect(button_positions[0], button_y, button_width, 25),
-            "All",
-            lambda: self._set_rarity_filter("all"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(all_button)
-        
-        common_button = Button(
-            pygame.Rect(button_positions[1], button_y, button_width, 25),
-            "Common",
-            lambda: self._set_rarity_filter("common"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(common_button)
-        
-        uncommon_button = Button(
-            pygame.Rect(button_positions[2], button_y, button_width, 25),
-            "Uncommon",
-            lambda: self._set_rarity_filter("uncommon"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(uncommon_button)
-        
-        rare_button = Button(
-            pygame.Rect(button_positions[3], button_y, button_width, 25),
-            "Rare",
-            lambda: self._set_rarity_filter("rare"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(rare_button)
-        
-        epic_button = Button(
-            pygame.Rect(button_positions[4], button_y, button_width, 25),
-            "Epic",
-            lambda: self._set_rarity_filter("epic"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(epic_button)
+        # Column offsets from the first filter button, shared by the rarity and cost rows
+        button_offsets = tuple(i * (button_width + button_spacing) for i in range(5))
+        filter_rect = pygame.Rect(100, button_y, button_width, 25)
+        
+        for x_offset, (text, rarity) in zip(button_offsets, _RARITY_FILTER_BUTTONS):
+            collection_panel.add_element(self._mk_button(
+                filter_rect.move(x_offset, 0),
+                text,
+                partial(self._set_rarity_filter, rarity)
+            ))
 
         # Filter by cost buttons
         cost_label = Label(
@@ -201,55 +257,13 @@ class DeckBuildingScreen(Screen):
         )
         collection_panel.add_element(cost_label)
         
-        cost_all_button = Button(
-            pygame.Rect(100, 85, button_width, 25),
-            "All",
-            lambda: self._set_cost_filter("all"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(cost_all_button)
-        
-        cost_0_button = Button(
-            pygame.Rect(100 + (button_width + button_spacing), 85, button_width, 25),
-            "0",
-            lambda: self._set_cost_filter(0),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(cost_0_button)
-        
-        cost_1_button = Button(
-            pygame.Rect(100 + (button_width + button_spacing) * 2, 85, button_width, 25),
-            "1",
-            lambda: self._set_cost_filter(1),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(cost_1_button)
-        
-        cost_2_button = Button(
-            pygame.Rect(100 + (button_width + button_spacing) * 3, 85, button_width, 25),
-            "2",
-            lambda: self._set_cost_filter(2),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(cost_2_button)
-        
-        cost_3_button = Button(
-            pygame.Rect(100 + (button_width + button_spacing) * 4, 85, button_width, 25),
-            "3",
-            lambda: self._set_cost_filter(3),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(cost_3_button)
+        cost_rect = filter_rect.move(0, 85 - button_y)
+        for x_offset, (text, cost) in zip(button_offsets, _COST_FILTER_BUTTONS):
+            collection_panel.add_element(self._mk_button(
+                cost_rect.move(x_offset, 0),
+                text,
+                partial(self._set_cost_filter, cost)
+            ))
         
         # Sort buttons
         sort_label = Label(
@@ -263,53 +277,27 @@ class DeckBuildingScreen(Screen):
         
         sort_width = 90
         
-        name_button = Button(
-            pygame.Rect(100, 120, sort_width, 25),
-            "Name",
-            lambda: self._set_sort_method("name"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(name_button)
-        
-        cost_button = Button(
-            pygame.Rect(100 + sort_width + button_spacing, 120, sort_width, 25),
-            "Cost",
-            lambda: self._set_sort_method("cost"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(cost_button)
-        
-        rarity_button = Button(
-            pygame.Rect(100 + (sort_width + button_spacing) * 2, 120, sort_width, 25),
-            "Rarity",
-            lambda: self._set_sort_method("rarity"),
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
-        )
-        collection_panel.add_element(rarity_button)
+        sort_rect = pygame.Rect(100, 120, sort_width, 25)
+        for i, (text, method) in enumerate(_SORT_BUTTONS):
+            collection_panel.add_element(self._mk_button(
+                sort_rect.move((sort_width + button_spacing) * i, 0),
+                text,
+                partial(self._set_sort_method, method)
+            ))
         
         # Page navigation
-        prev_page_button = Button(
+        prev_page_button = self._mk_button(
             pygame.Rect(20, collection_panel.rect.height - 40, 120, 30),
             "< Previous",
             self._prev_collection_page,
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
             font_size=16
         )
         collection_panel.add_element(prev_page_button)
         
-        next_page_button = Button(
+        next_page_button = self._mk_button(
             pygame.Rect(collection_panel.rect.width - 140, collection_panel.rect.height - 40, 120, 30),
             "Next >",
             self._next_collection_page,
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
             font_size=16
         )
         collection_panel.add_element(next_page_button)
@@ -363,33 +351,24 @@ class DeckBuildingScreen(Screen):
         deck_panel.add_element(self.deck_stats)
         
         # Deck management buttons (small row beneath stats)
-        manage_decks_button = Button(
+        manage_decks_button = self._mk_button(
             pygame.Rect(20, 90, 120, 25),
             "Manage Decks",
-            self._show_deck_list,
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
+            self._show_deck_list
         )
         deck_panel.add_element(manage_decks_button)
         
-        rename_deck_button = Button(
+        rename_deck_button = self._mk_button(
             pygame.Rect(150, 90, 100, 25),
             "Rename",
-            self._rename_current_deck,
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
+            self._rename_current_deck
         )
         deck_panel.add_element(rename_deck_button)
         
-        duplicate_deck_button = Button(
+        duplicate_deck_button = self._mk_button(
             pygame.Rect(260, 90, 100, 25),
             "Duplicate",
-            self._duplicate_current_deck,
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
-            font_size=14
+            self._duplicate_current_deck
         )
         deck_panel.add_element(duplicate_deck_button)
         
@@ -404,22 +383,18 @@ class DeckBuildingScreen(Screen):
         deck_panel.add_element(self.validation_label)
         
         # Deck page navigation
-        prev_deck_page_button = Button(
+        prev_deck_page_button = self._mk_button(
             pygame.Rect(20, deck_panel.rect.height - 40, 120, 30),
             "< Previous",
             self._prev_deck_page,
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
             font_size=16
         )
         deck_panel.add_element(prev_deck_page_button)
         
-        next_deck_page_button = Button(
+        next_deck_page_button = self._mk_button(
             pygame.Rect(deck_panel.rect.width - 140, deck_panel.rect.height - 40, 120, 30),
             "Next >",
             self._next_deck_page,
-            color=(80, 80, 100),
-            hover_color=(100, 100, 130),
             font_size=16
         )
         deck_panel.add_element(next_deck_page_button)
@@ -443,46 +418,46 @@ class DeckBuildingScreen(Screen):
         )
         
         # Save button
-        save_button = Button(
+        save_button = self._mk_button(
             pygame.Rect(20, 10, 150, 30),
             "Save Deck",
             self._save_deck,
+            font_size=18,
             color=(60, 120, 60),
-            hover_color=(80, 160, 80),
-            font_size=18
+            hover_color=(80, 160, 80)
         )
         control_panel.add_element(save_button)
         
         # New deck button
-        new_deck_button = Button(
+        new_deck_button = self._mk_button(
             pygame.Rect(190, 10, 150, 30),
             "New Deck",
             self._new_deck,
+            font_size=18,
             color=(60, 60, 120),
-            hover_color=(80, 80, 160),
-            font_size=18
+            hover_color=(80, 80, 160)
         )
         control_panel.add_element(new_deck_button)
         
         # Clear deck button
-        clear_deck_button = Button(
+        clear_deck_button = self._mk_button(
             pygame.Rect(360, 10, 150, 30),
             "Clear Deck",
             self._clear_deck,
+            font_size=18,
             color=(120, 60, 60),
-            hover_color=(160, 80, 80),
-            font_size=18
+            hover_color=(160, 80, 80)
         )
         control_panel.add_element(clear_deck_button)
         
         # Set as active deck button
-        activate_button = Button(
+        activate_button = self._mk_button(
             pygame.Rect(530, 10, 150, 30),
             "Set as Active",
             self._set_as_active_deck,
+            font_size=18,
             color=(120, 120, 60),
-            hover_color=(160, 160, 80),
-            font_size=18
+            hover_color=(160, 160, 80)
         )
         control_panel.add_element(activate_button)
         
@@ -497,18 +472,52 @@ class DeckBuildingScreen(Screen):
         control_panel.add_element(self.status_label)
         
         # Back button
-        back_button = Button(
+        back_button = self._mk_button(
             pygame.Rect(control_panel.rect.width - 170, 10, 150, 30),
             "Back to Menu",
             self._back_to_menu,
+            font_size=18,
             color=(100, 100, 100),
-            hover_color=(140, 140, 140),
-            font_size=18
+            hover_color=(140, 140, 140)
         )
         control_panel.add_element(back_button)
         
         # Add all panels to UI elements
         self.ui_elements = [title_panel, collection_panel, deck_panel, control_panel]
+        
+        # Deck name dialog, shown on demand
+        self._create_deck_name_dialog()
+        
+        # The background and title never change, so they are drawn once into
+        # a cached layer on the first render
+        self._title_panel = title_panel
+        self._static_layer = None
+    
+    def _mk_button(self, rect, text, callback, font_size=14,
+                   color=(80, 80, 100), hover_color=(100, 100, 130)):
+        """
+        Create a button using the shared font for its size.
+        
+        Args:
+            rect (pygame.Rect): The button's rectangle
+            text (str): Text to display on the button
+            callback: Function to call when the button is clicked
+            font_size (int): Size of the font
+            color (tuple): RGB color of the button
+            hover_color (tuple): RGB color when the button is hovered
+            
+        Returns:
+            Button: The new button
+        """
+        return Button(
+            rect,
+            text,
+            callback,
+            color=color,
+            hover_color=hover_color,
+            font_size=font_size,
+            font=_button_font(font_size)
+        )
     
     def on_enter(self, previous_screen=None, **kwargs):
         """
@@ -535,6 +544,18 @@ class DeckBuildingScreen(Screen):
         # Update UI
         self._update_ui()
     
+    def on_exit(self, next_screen=None):
+        """
+        Called when this screen is no longer active.
+        
+        Args:
+            next_screen: The screen that will become active
+        """
+        super().on_exit(next_screen)
+        
+        # Stop decoding card art for pages that will not be shown
+        self.card_renderer.close()
+    
     def _load_data(self):
         """Load card database and player data."""
         # Load card database
@@ -546,28 +567,59 @@ class DeckBuildingScreen(Screen):
             
             # Set current deck to player's deck
             if self.player:
-                self.current_deck = self.player.deck
+                self._set_current_deck(self.player.deck)
         
-        # Load card images for renderer
-        for card_id, card in self.card_database.items():
-            self.card_renderer.load_card_image(card_id, card.image_path)
+        # Card art is loaded when first shown, with the next pages decoded
+        # in the background by _update_page_cards
+        self._build_collection_view()
+    
+    def _set_current_deck(self, deck):
+        """
+        Make a deck the one being edited.
+        
+        Args:
+            deck (Deck): Deck to edit
+        """
+        self.current_deck = deck
+        self._deck_id_counts = Counter(card.id for card in deck.cards)
+    
+    def _build_collection_view(self):
+        """Group the player's owned cards by rarity and drop cached views."""
+        by_rarity = {"all": [], "common": [], "uncommon": [], "rare": [], "epic": []}
+        
+        if self.player:
+            for card_id, quantity in self.player.collection.items():
+                card = self.card_database.get(card_id)
+                if card is None:
+                    continue
+                
+                entry = (card.name, card.cost, _RARITY_ORDER.get(card.rarity, 0), card, quantity)
+                by_rarity["all"].append(entry)
+                bucket = by_rarity.get(card.rarity)
+                if bucket is not None:
+                    bucket.append(entry)
+        
+        self._cards_by_rarity = by_rarity
+        self._sorted_variants = {}
+        self._collection_total = sum(self.player.collection.values()) if self.player else 0
+        self._collection_version += 1
     
     def _update_ui(self):
         """Update UI elements based on the current state."""
+        self._update_page_cards()
+        
         if not self.player or not self.current_deck:
             return
         
         # Update collection count
-        total_cards = sum(self.player.collection.values())
-        self.collection_count.set_text(f"Cards: {total_cards}")
+        self.collection_count.set_text(f"Cards: {self._collection_total}")
         
         # Update deck info
         self.deck_title.set_text(f"Deck: {self.current_deck.name}")
         self.deck_count.set_text(f"Cards: {self.current_deck.size()}/30")
         
         # Update page labels
-        filtered_cards = self._get_filtered_cards()
-        total_collection_pages = max(1, (len(filtered_cards) + self.cards_per_page - 1) // self.cards_per_page)
+        total_collection_pages = self._get_collection_page_count()
         self.page_label.set_text(f"Page {self.collection_page + 1}/{total_collection_pages}")
         
         total_deck_pages = max(1, (self.current_deck.size() + self.cards_per_page - 1) // self.cards_per_page)
@@ -579,22 +631,43 @@ class DeckBuildingScreen(Screen):
         # Update deck validation
         self._update_deck_validation()
         
-        # Update status message
+        # Update status message, leaving the label alone if it already shows it
         if self.status_message:
-            self.status_label.set_text(self.status_message)
-            self.status_label.color = self.status_message_color
+            if self.status_label.text != self.status_message:
+                self.status_label.set_text(self.status_message)
+            if self.status_label.color != self.status_message_color:
+                self.status_label.color = self.status_message_color
+    
+    def _update_page_cards(self):
+        """Slice out the cards shown on the current collection and deck pages."""
+        per_page = self.cards_per_page
+        filtered_cards = self._get_filtered_cards()
+        start_idx = self.collection_page * per_page
+        self._current_page_cards = filtered_cards[start_idx:start_idx + per_page]
+        
+        # Decode the art for the current and next collection pages ahead of
+        # time; cards already loaded are skipped, and older prefetches dropped
+        upcoming = [card for card, _ in filtered_cards[start_idx:start_idx + 2 * per_page]]
+        
+        if self.current_deck:
+            start_idx = self.deck_page * per_page
+            self._current_deck_page_cards = self.current_deck.cards[start_idx:start_idx + per_page]
+            upcoming.extend(self.current_deck.cards[start_idx:start_idx + 2 * per_page])
+        else:
+            self._current_deck_page_cards = []
+        
+        self.card_renderer.prefetch_card_images(upcoming)
     
     def _update_deck_stats(self):
         """Update the deck statistics display."""
         if not self.current_deck:
             return
         
-        # Get deck stats
+        # Get deck stats; the deck caches them until its cards change
         stats = self.current_deck.get_stats()
         
         # Calculate average cost
-        total_cost = sum(card.cost for card in self.current_deck.cards)
-        avg_cost = total_cost / max(1, len(self.current_deck.cards))
+        avg_cost = stats["total_cost"] / max(1, stats["size"])
         
         # Format stats
         stats_text = f"Avg Cost: {avg_cost:.1f} | "
@@ -630,34 +703,48 @@ class DeckBuildingScreen(Screen):
         if not self.player:
             return []
         
-        filtered_cards = []
+        cache_key = (self.current_rarity_filter, self.current_cost_filter,
+                     self.sort_method, self._collection_version)
+        if self._filtered_cache is not None and self._filtered_cache_key == cache_key:
+            return self._filtered_cache
         
-        for card_id, quantity in self.player.collection.items():
-            if card_id in self.card_database:
-                card = self.card_database[card_id]
-                
-                # Apply rarity filter
-                rarity_match = (self.current_rarity_filter == "all" or 
-                               card.rarity == self.current_rarity_filter)
-                
-                # Apply cost filter
-                cost_match = (self.current_cost_filter == "all" or 
-                             card.cost == self.current_cost_filter)
-                
-                if rarity_match and cost_match:
-                    filtered_cards.append((card, quantity))
-        
-        # Apply sorting
-        if self.sort_method == "name":
-            filtered_cards.sort(key=lambda x: x[0].name)
-        elif self.sort_method == "cost":
-            filtered_cards.sort(key=lambda x: x[0].cost)
-        elif self.sort_method == "rarity":
-            rarity_order = {"common": 0, "uncommon": 1, "rare": 2, "epic": 3}
-            filtered_cards.sort(key=lambda x: rarity_order.get(x[0].rarity, 0))
+        # Sorted rarity bucket, built once per (rarity, sort) pair
+        variant_key = (self.current_rarity_filter, self.sort_method)
+        variant = self._sorted_variants.get(variant_key)
+        if variant is None:
+            variant = list(self._cards_by_rarity.get(self.current_rarity_filter, ()))
+            
+            sort_key = _SORT_KEYS.get(self.sort_method)
+            if sort_key is not None:
+                variant.sort(key=sort_key)
+            
+            self._sorted_variants[variant_key] = variant
         
+        # Apply cost filter
+        if self.current_cost_filter == "all":
+            filtered_cards = [(entry[3], entry[4]) for entry in variant]
+        else:
+            cost = self.current_cost_filter
+            filtered_cards = [(entry[3], entry[4]) for entry in variant if entry[1] == cost]
+        
+        self._filtered_cache = filtered_cards
+        self._filtered_cache_key = cache_key
+        self._filtered_page_count = max(1, (len(filtered_cards) + self.cards_per_page - 1) // self.cards_per_page)
         return filtered_cards
     
+    def _get_collection_page_count(self) -> int:
+        """
+        Get the number of collection pages for the current filters.
+        
+        Returns:
+            int: Page count, at least 1
+        """
+        if not self.player:
+            return 1
+        
+        self._get_filtered_cards()
+        return self._filtered_page_count
+    
     def _set_rarity_filter(self, rarity):
         """
         Set the rarity filter.
@@ -698,8 +785,7 @@ class DeckBuildingScreen(Screen):
     
     def _next_collection_page(self):
         """Go to the next page of the collection."""
-        filtered_cards = self._get_filtered_cards()
-        total_pages = max(1, (len(filtered_cards) + self.cards_per_page - 1) // self.cards_per_page)
+        total_pages = self._get_collection_page_count()
         
         if self.collection_page < total_pages - 1:
             self.collection_page += 1
@@ -738,7 +824,7 @@ class DeckBuildingScreen(Screen):
         
         if success:
             # Save player data
-            SaveManager.save_player(self.player)
+            SaveManager.save_player_async(self.player)
             self._set_status_message(message, (100, 255, 100))
         else:
             self._set_status_message(message, (255, 100, 100))
@@ -759,7 +845,7 @@ class DeckBuildingScreen(Screen):
         
         if success:
             # Save player data
-            SaveManager.save_player(self.player)
+            SaveManager.save_player_async(self.player)
             self._set_status_message(message, (100, 255, 100))
         else:
             self._set_status_message(message, (255, 100, 100))
@@ -772,14 +858,14 @@ class DeckBuildingScreen(Screen):
         # Create a deck name input dialog
         self._show_deck_name_dialog(create_new=True)
     
-    def _show_deck_name_dialog(self, create_new=True, old_name=None):
-        """Show a dialog to input the deck name."""
-        # Create semi-transparent overlay for the entire screen
-        self.dialog_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.dialog_overlay.fill((0, 0, 0, 150))  # Semi-transparent black
-        
-        # Create dialog panel
-        dialog_panel = Panel(
+    def _create_deck_name_dialog(self):
+        """Build the deck name dialog once; it is reused every time it opens."""
+        # Semi-transparent overlay for the entire screen
+        self._name_dialog_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self._name_dialog_overlay.fill((0, 0, 0, 150))  # Semi-transparent black
+        
+        # Dialog panel
+        self._name_dialog_panel = Panel(
             pygame.Rect(self.width // 2 - 150, self.height // 2 - 100, 300, 200),
             color=(50, 55, 70),
             border_color=(100, 110, 140),
@@ -788,63 +874,74 @@ class DeckBuildingScreen(Screen):
         )
         
         # Dialog title
-        title_text = "New Deck" if create_new else "Rename Deck"
-        dialog_title = Label(
+        self._name_dialog_title = Label(
             pygame.Rect(0, 20, 300, 30),
-            title_text,
+            "New Deck",
             color=(220, 220, 220),
             font_size=22,
             align='center'
         )
-        dialog_panel.add_element(dialog_title)
+        self._name_dialog_panel.add_element(self._name_dialog_title)
         
         # Input field (simulated with a label)
-        self.deck_name_input = "New Deck" if create_new else old_name
-        self.rename_old_name = old_name
-        
-        self.name_label = Label(
+        self._name_dialog_label = Label(
             pygame.Rect(50, 70, 200, 30),
-            self.deck_name_input,
+            "",
             color=(255, 255, 255),
             font_size=18,
             align='center'
         )
-        dialog_panel.add_element(self.name_label)
+        self._name_dialog_panel.add_element(self._name_dialog_label)
         
         # Input field border
-        input_border_rect = pygame.Rect(50, 70, 200, 30)
-        
-        # Create buttons
-        button_text = "Create" if create_new else "Rename"
-        callback = self._create_new_deck if create_new else self._finish_rename_deck
+        self._name_dialog_border = pygame.Rect(50, 70, 200, 30)
         
-        confirm_button = Button(
+        # Buttons; the confirm text and callback are set when the dialog opens
+        self._name_dialog_confirm = self._mk_button(
             pygame.Rect(50, 120, 90, 30),
-            button_text,
-            callback,
+            "Create",
+            self._create_new_deck,
+            font_size=16,
             color=(60, 120, 60),
-            hover_color=(80, 160, 80),
-            font_size=16
+            hover_color=(80, 160, 80)
         )
-        dialog_panel.add_element(confirm_button)
+        self._name_dialog_panel.add_element(self._name_dialog_confirm)
         
-        cancel_button = Button(
+        cancel_button = self._mk_button(
             pygame.Rect(160, 120, 90, 30),
             "Cancel",
             self._close_deck_name_dialog,
+            font_size=16,
             color=(120, 60, 60),
-            hover_color=(160, 80, 80),
-            font_size=16
+            hover_color=(160, 80, 80)
         )
-        dialog_panel.add_element(cancel_button)
+        self._name_dialog_panel.add_element(cancel_button)
+    
+    def _show_deck_name_dialog(self, create_new=True, old_name=None):
+        """Show a dialog to input the deck name."""
+        self._close_deck_name_dialog()
         
-        # Store the dialog and add to UI elements
-        self.deck_name_dialog = dialog_panel
-        self.deck_name_input_border = input_border_rect
+        # Input field (simulated with a label)
+        self.deck_name_input = "New Deck" if create_new else old_name
+        self.rename_old_name = old_name
+        
+        # Fill in the pooled dialog for this use
+        self._name_dialog_title.set_text("New Deck" if create_new else "Rename Deck")
+        self._name_dialog_label.set_text(self.deck_name_input)
+        self._name_dialog_confirm.text = "Create" if create_new else "Rename"
+        self._name_dialog_confirm.callback = (
+            self._create_new_deck if create_new else self._finish_rename_deck
+        )
+        
+        # Mark the dialog as open
+        self.deck_name_dialog = self._name_dialog_panel
+        self.dialog_overlay = self._name_dialog_overlay
+        self.name_label = self._name_dialog_label
+        self.deck_name_input_border = self._name_dialog_border
         
         # Add overlay first, then dialog (in correct z-order)
         self.ui_elements.append(self.dialog_overlay)
-        self.ui_elements.append(dialog_panel)
+        self.ui_elements.append(self.deck_name_dialog)
     
     def _create_new_deck(self):
         """Create a new deck with the entered name."""
@@ -855,7 +952,7 @@ class DeckBuildingScreen(Screen):
             return
         
         # Create a new deck
-        self.current_deck = Deck(name=self.deck_name_input)
+        self._set_current_deck(Deck(name=self.deck_name_input))
         
         # Close the dialog
         self._close_deck_name_dialog()
@@ -882,10 +979,10 @@ class DeckBuildingScreen(Screen):
         
         if success:
             # Update current deck reference
-            self.current_deck = self.player.decks[self.deck_name_input]
+            self._set_current_deck(self.player.decks[self.deck_name_input])
             
             # Save player data
-            SaveManager.save_player(self.player)
+            SaveManager.save_player_async(self.player)
             self._set_status_message(message, (100, 255, 100))
         else:
             self._set_status_message(message, (255, 100, 100))
@@ -922,10 +1019,10 @@ class DeckBuildingScreen(Screen):
         
         if success:
             # Set current deck to the duplicate
-            self.current_deck = self.player.decks[new_name]
+            self._set_current_deck(self.player.decks[new_name])
             
             # Save player data
-            SaveManager.save_player(self.player)
+            SaveManager.save_player_async(self.player)
             self._set_status_message(message, (100, 255, 100))
             
             # Update UI
@@ -935,13 +1032,32 @@ class DeckBuildingScreen(Screen):
     
     def _close_deck_name_dialog(self):
         """Close the deck name dialog."""
-        if hasattr(self, 'deck_name_dialog') and self.deck_name_dialog in self.ui_elements:
-            self.ui_elements.remove(self.deck_name_dialog)
-            del self.deck_name_dialog
+        if self.deck_name_dialog is None:
+            return
+        
+        for element in (self.dialog_overlay, self.deck_name_dialog):
+            if element in self.ui_elements:
+                self.ui_elements.remove(element)
+        
+        self.deck_name_dialog = None
+        self.dialog_overlay = None
+        self.name_label = None
+        self.deck_name_input_border = None
     
     def _show_deck_list(self):
         """Show the list of saved decks."""
-        if not self.player:
+        if not self.player or self.showing_deck_list:
+            return
+        
+        # Get list of decks
+        deck_names = self.player.get_deck_list()
+        active_deck_name = self.player.get_active_deck_name()
+        
+        # Reuse the last panel while the decks and active deck are unchanged
+        deck_list_key = (tuple(deck_names), active_deck_name)
+        if self.deck_list_panel is not None and deck_list_key == self._deck_list_key:
+            self.showing_deck_list = True
+            self.ui_elements.append(self.deck_list_panel)
             return
         
         # Create deck list panel
@@ -963,10 +1079,6 @@ class DeckBuildingScreen(Screen):
         )
         deck_list_panel.add_element(list_title)
         
-        # Get list of decks
-        deck_names = self.player.get_deck_list()
-        active_deck_name = self.player.get_active_deck_name()
-        
         # Create deck buttons
         button_height = 30
         button_margin = 5
@@ -983,33 +1095,30 @@ class DeckBuildingScreen(Screen):
                 hover_color = (100, 100, 130)
                 text = deck_name
             
-            # Create closure to capture the current deck name
-            def make_load_callback(name):
-                return lambda: self._load_deck(name)
-            
-            deck_button = Button(
+            deck_button = self._mk_button(
                 pygame.Rect(50, button_y + i * (button_height + button_margin), 300, button_height),
                 text,
-                make_load_callback(deck_name),
+                partial(self._load_deck, deck_name),
+                font_size=16,
                 color=deck_color,
-                hover_color=hover_color,
-                font_size=16
+                hover_color=hover_color
             )
             deck_list_panel.add_element(deck_button)
         
         # Close button
-        close_button = Button(
+        close_button = self._mk_button(
             pygame.Rect(150, 350, 100, 30),
             "Close",
             self._close_deck_list,
+            font_size=16,
             color=(100, 100, 100),
-            hover_color=(140, 140, 140),
-            font_size=16
+            hover_color=(140, 140, 140)
         )
         deck_list_panel.add_element(close_button)
         
         # Store the panel
         self.deck_list_panel = deck_list_panel
+        self._deck_list_key = deck_list_key
         self.showing_deck_list = True
         
         # Add to UI elements
@@ -1032,7 +1141,7 @@ class DeckBuildingScreen(Screen):
             return
         
         # Set current deck
-        self.current_deck = self.player.decks[deck_name]
+        self._set_current_deck(self.player.decks[deck_name])
         
         # Close deck list
         self._close_deck_list()
@@ -1050,7 +1159,8 @@ class DeckBuildingScreen(Screen):
             return
         
         # Keep the name but clear the cards
-        self.current_deck.cards = []
+        self.current_deck.clear()
+        self._deck_id_counts.clear()
         
         # Update UI
         self._update_ui()
@@ -1060,7 +1170,7 @@ class DeckBuildingScreen(Screen):
         """Return to the main menu."""
         # Save player data before leaving
         if self.player:
-            SaveManager.save_player(self.player)
+            SaveManager.save_player_async(self.player)
         
         # Return to home screen
         self.switch_to_screen("home")
@@ -1075,19 +1185,16 @@ class DeckBuildingScreen(Screen):
         if not self.current_deck:
             return
         
-        # Try to add the card
-        if self.current_deck.add_card(card):
+        # Check the deck rules against the tracked counts before adding
+        if len(self.current_deck.cards) >= Deck.MAX_DECK_SIZE:
+            self._set_status_message(f"Deck is full (max {Deck.MAX_DECK_SIZE} cards)", (255, 100, 100))
+        elif self._deck_id_counts[card.id] >= Deck.MAX_COPIES_PER_CARD:
+            self._set_status_message(
+                f"Max {Deck.MAX_COPIES_PER_CARD} copies of {card.name} allowed", (255, 100, 100)
+            )
+        elif self.current_deck.add_card(card):
+            self._deck_id_counts[card.id] += 1
             self._set_status_message(f"Added {card.name} to deck", (100, 255, 100))
-        else:
-            # Check why it failed
-            if len(self.current_deck.cards) >= Deck.MAX_DECK_SIZE:
-                self._set_status_message(f"Deck is full (max {Deck.MAX_DECK_SIZE} cards)", (255, 100, 100))
-            else:
-                # Count how many of this card are already in the deck
-                count = sum(1 for c in self.current_deck.cards if c.id == card.id)
-                self._set_status_message(
-                    f"Max {Deck.MAX_COPIES_PER_CARD} copies of {card.name} allowed", (255, 100, 100)
-                )
         
         # Update UI
         self._update_ui()
@@ -1112,6 +1219,9 @@ class DeckBuildingScreen(Screen):
             
             # Remove the card
             self.current_deck.remove_card(actual_index)
+            self._deck_id_counts[card.id] -= 1
+            if self._deck_id_counts[card.id] <= 0:
+                del self._deck_id_counts[card.id]
             
             self._set_status_message(f"Removed {card.name} from deck", (255, 200, 100))
             
@@ -1134,16 +1244,17 @@ class DeckBuildingScreen(Screen):
         self.status_label.set_text(message)
         self.status_label.color = color
         
-        # Add a background to the status label for better readability
-        label_rect = self.status_label.rect
-        bg_color = (40, 45, 60, 200)  # Semi-transparent background
-        
-        # Create and store background surface
-        self.status_bg = pygame.Surface((label_rect.width, label_rect.height), pygame.SRCALPHA)
-        self.status_bg.fill(bg_color)
-        pygame.draw.rect(self.status_bg, (80, 90, 120, 200), 
-                       pygame.Rect(0, 0, label_rect.width, label_rect.height), 
-                       width=1, border_radius=5)
+        # Add a background to the status label for better readability; it
+        # only depends on the label size, so it is created once
+        if self.status_bg is None:
+            label_rect = self.status_label.rect
+            bg_color = (40, 45, 60, 200)  # Semi-transparent background
+            
+            self.status_bg = pygame.Surface((label_rect.width, label_rect.height), pygame.SRCALPHA)
+            self.status_bg.fill(bg_color)
+            pygame.draw.rect(self.status_bg, (80, 90, 120, 200), 
+                           pygame.Rect(0, 0, label_rect.width, label_rect.height), 
+                           width=1, border_radius=5)
     
     def handle_event(self, event):
         """
@@ -1160,12 +1271,12 @@ class DeckBuildingScreen(Screen):
             return True
         
         # Special handling for deck name input
-        if hasattr(self, 'deck_name_dialog') and event.type == pygame.KEYDOWN:
+        if self.deck_name_dialog is not None and event.type == pygame.KEYDOWN:
             # Handle typing in the deck name
             if event.key == pygame.K_BACKSPACE:
                 self.deck_name_input = self.deck_name_input[:-1]
             elif event.key == pygame.K_RETURN:
-                if hasattr(self, 'rename_old_name'):
+                if self.rename_old_name is not None:
                     self._finish_rename_deck()
                 else:
                     self._create_new_deck()
@@ -1174,14 +1285,13 @@ class DeckBuildingScreen(Screen):
                 if len(self.deck_name_input) < 20:
                     self.deck_name_input += event.unicode
             
-            # Update the displayed name
-            if hasattr(self, 'name_label'):
-                self.name_label.set_text(self.deck_name_input)
+            # Update the displayed name once per frame, in update()
+            self._name_label_stale = True
             
             return True
         
         # Don't handle clicks if a dialog is open
-        if hasattr(self, 'deck_name_dialog') or self.showing_deck_list:
+        if self.deck_name_dialog is not None or self.showing_deck_list:
             return False
         
         # Handle mouse clicks on cards in collection or deck
@@ -1211,28 +1321,26 @@ class DeckBuildingScreen(Screen):
         if not self.player:
             return False
         
-        # Get filtered cards
+        # Find the slot under the mouse
+        slot = self._slot_at(pos, self._collection_slot_rects)
+        if slot is None:
+            return False
+        
+        # Check there is a card in that slot on the current page
         filtered_cards = self._get_filtered_cards()
+        card_index = self.collection_page * self.cards_per_page + slot
+        if card_index >= len(filtered_cards):
+            return False
         
-        # Calculate the cards on the current page
-        start_idx = self.collection_page * self.cards_per_page
-        end_idx = min(start_idx + self.cards_per_page, len(filtered_cards))
-        page_cards = filtered_cards[start_idx:end_idx]
+        card, quantity = filtered_cards[card_index]
         
-        # Check if a card was clicked
-        for i, (card, quantity) in enumerate(page_cards):
-            card_rect = self._get_collection_card_rect(i)
-            
-            if card_rect.collidepoint(pos):
-                # Select this card
-                self.selected_collection_card = card
-                
-                # If clicked with left button, try to add to deck
-                self._add_card_to_deck(card)
-                
-                return True
+        # Select this card
+        self.selected_collection_card = card
         
-        return False
+        # If clicked with left button, try to add to deck
+        self._add_card_to_deck(card)
+        
+        return True
     
     def _handle_deck_click(self, pos):
         """
@@ -1247,29 +1355,54 @@ class DeckBuildingScreen(Screen):
         if not self.current_deck:
             return False
         
-        # Calculate the cards on the current page
-        start_idx = self.deck_page * self.cards_per_page
-        end_idx = min(start_idx + self.cards_per_page, self.current_deck.size())
+        # Find the slot under the mouse
+        slot = self._slot_at(pos, self._deck_slot_rects)
+        if slot is None:
+            return False
         
-        # Check if a card was clicked
-        for i in range(end_idx - start_idx):
-            card_rect = self._get_deck_card_rect(i)
-            
-            if card_rect.collidepoint(pos):
-                # Get the actual index in the deck
-                actual_index = i
-                
-                # Select this card
-                card_index = start_idx + i
-                if card_index < self.current_deck.size():
-                    self.selected_deck_card = card_index
-                
-                # If clicked with left button, remove from deck
-                self._remove_card_from_deck(actual_index)
-                
-                return True
+        # Check there is a card in that slot on the current page
+        card_index = self.deck_page * self.cards_per_page + slot
+        if card_index >= self.current_deck.size():
+            return False
         
-        return False
+        # Select this card
+        self.selected_deck_card = card_index
+        
+        # If clicked with left button, remove from deck
+        self._remove_card_from_deck(slot)
+        
+        return True
+    
+    def _slot_at(self, pos, slot_rects):
+        """
+        Work out which card slot of a 2-column grid contains a point.
+        
+        Args:
+            pos (tuple): Mouse position
+            slot_rects (list): Slot rectangles of the grid, first slot top-left
+            
+        Returns:
+            int or None: Slot index on the page, or None if outside every slot
+        """
+        card_width, card_height = self.card_renderer.card_size
+        margin = 20
+        origin = slot_rects[0]
+        
+        dx = pos[0] - origin.left
+        dy = pos[1] - origin.top
+        if dx < 0 or dy < 0:
+            return None
+        
+        # Reject points in the margins between cards
+        col, x_offset = divmod(dx, card_width + margin)
+        row, y_offset = divmod(dy, card_height + margin)
+        if col >= 2 or x_offset >= card_width or y_offset >= card_height:
+            return None
+        
+        slot = row * 2 + col
+        if slot >= len(slot_rects):
+            return None
+        return slot
     
     def _get_collection_card_rect(self, index):
         """
@@ -1334,6 +1467,12 @@ class DeckBuildingScreen(Screen):
         """
         super().update(dt)
         
+        # Show the typed deck name; several keys in one frame share this update
+        if self._name_label_stale:
+            self._name_label_stale = False
+            if self.name_label is not None and self.name_label.text != self.deck_name_input:
+                self.name_label.set_text(self.deck_name_input)
+        
         # Update status message timer
         if self.status_message and self.status_message_timer > 0:
             self.status_message_timer -= dt
@@ -1343,33 +1482,37 @@ class DeckBuildingScreen(Screen):
     
     def render(self):
         """Render the deck building screen."""
-        # Draw background
-        self.display.fill(self.background_color)
+        # Draw background and title from the cached static layer
+        if self._static_layer is None:
+            self._static_layer = pygame.Surface(self.display.get_size())
+            self._static_layer.fill(self.background_color)
+            self._title_panel.render(self._static_layer)
+            if pygame.display.get_surface() is not None:
+                self._static_layer = self._static_layer.convert()
+        self.display.blit(self._static_layer, (0, 0))
         
         # Render UI elements (standard panels first)
-        base_elements = [elem for elem in self.ui_elements 
-                        if elem not in [self.deck_name_dialog] 
-                        and not hasattr(self, 'dialog_overlay') or elem != self.dialog_overlay]
-        
-        for element in base_elements:
-            element.render(self.display)
+        for element in self.ui_elements:
+            if (element is not self._title_panel and element is not self.deck_name_dialog
+                    and element is not self.dialog_overlay):
+                element.render(self.display)
         
         # Render collection cards and deck cards
         self._render_collection()
         self._render_deck()
         
         # Now render dialog overlay and dialogs on top
-        if hasattr(self, 'dialog_overlay') and self.dialog_overlay in self.ui_elements:
+        if self.dialog_overlay is not None:
             self.display.blit(self.dialog_overlay, (0, 0))
             
-        if hasattr(self, 'deck_name_dialog') and self.deck_name_dialog in self.ui_elements:
+        if self.deck_name_dialog is not None:
             self.deck_name_dialog.render(self.display)
             pygame.draw.rect(self.display, (80, 80, 100), self.deck_name_input_border, width=2)
             # Add highlight for input field
             pygame.draw.rect(self.display, (100, 100, 150, 128), self.deck_name_input_border, width=0)
         
         # Draw status message background if message exists
-        if self.status_message and hasattr(self, 'status_bg'):
+        if self.status_message and self.status_bg is not None:
             status_rect = self.status_label.rect
             offset_rect = status_rect.move(self.ui_elements[3].rect.left, self.ui_elements[3].rect.top)
             self.display.blit(self.status_bg, offset_rect)
@@ -1379,110 +1522,121 @@ class DeckBuildingScreen(Screen):
         if not self.player:
             return
         
-        # Get filtered cards
-        filtered_cards = self._get_filtered_cards()
+        # Cards on the current page
+        page_cards = self._current_page_cards
+        
+        # Draw the cards, with their faces blitted in one batch
+        self.card_renderer.render_cards(
+            self.display,
+            [(card, self._collection_slot_rects[i].topleft, card == self.selected_collection_card)
+             for i, (card, quantity) in enumerate(page_cards)],
+            selectable=True
+        )
         
-        # Calculate the cards on the current page
-        start_idx = self.collection_page * self.cards_per_page
-        end_idx = min(start_idx + self.cards_per_page, len(filtered_cards))
-        page_cards = filtered_cards[start_idx:end_idx]
+        # Text and hint surfaces drawn over the cards, blitted in one batch
+        overlays = []
         
-        # Draw each card
         for i, (card, quantity) in enumerate(page_cards):
-            card_rect = self._get_collection_card_rect(i)
-            
-            # Draw the card
-            self.card_renderer.render_card(
-                self.display, 
-                card, 
-                (card_rect.left, card_rect.top),
-                selectable=True,
-                selected=card == self.selected_collection_card
-            )
+            card_rect = self._collection_slot_rects[i]
             
             # Draw quantity indicator
             quantity_bg = pygame.Rect(card_rect.right - 25, card_rect.top + 5, 20, 20)
-            pygame.draw.rect(self.display, (50, 50, 70), quantity_bg, border_radius=10)
-            pygame.draw.rect(self.display, (100, 100, 130), quantity_bg, width=1, border_radius=10)
+            overlays.append((self._qty_badge, quantity_bg))
             
-            font = pygame.freetype.SysFont('Arial', 14)
-            qty_surf, qty_rect = font.render(str(quantity), (220, 220, 220))
+            qty_surf, qty_rect = self._get_badge_text(str(quantity))
             qty_rect.center = quantity_bg.center
-            self.display.blit(qty_surf, qty_rect)
+            overlays.append((qty_surf, qty_rect))
             
             # Add "Add to Deck" hint with background
             if self.current_deck:
-                card_count = sum(1 for c in self.current_deck.cards if c.id == card.id)
+                card_count = self._deck_id_counts[card.id]
                 can_add = (len(self.current_deck.cards) < Deck.MAX_DECK_SIZE and 
                           card_count < Deck.MAX_COPIES_PER_CARD)
                 
                 if can_add:
-                    hint_font = pygame.freetype.SysFont('Arial', 10)
-                    hint_text = "Click to add"
-                    hint_surf, hint_rect = hint_font.render(hint_text, (220, 220, 220))
-                    
-                    # Create background for text
-                    bg_rect = hint_rect.copy()
-                    bg_rect.width += 10  # Padding
-                    bg_rect.height += 6
-                    bg_rect.centerx = card_rect.centerx
-                    bg_rect.bottom = card_rect.bottom - 5
-                    
-                    # Draw semi-transparent background
-                    bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                    bg_surface.fill((40, 45, 60, 180))  # Semi-transparent background
-                    pygame.draw.rect(bg_surface, (80, 90, 120, 200), 
-                                    pygame.Rect(0, 0, bg_rect.width, bg_rect.height), 
-                                    width=1, border_radius=3)
-                    
-                    self.display.blit(bg_surface, bg_rect)
-                    
-                    # Position text over background
-                    hint_rect.centerx = bg_rect.centerx
-                    hint_rect.centery = bg_rect.centery
-                    self.display.blit(hint_surf, hint_rect)
+                    hint_rect = self._add_hint.get_rect(
+                        midbottom=(card_rect.centerx, card_rect.bottom - 5)
+                    )
+                    overlays.append((self._add_hint, hint_rect))
+        
+        self.display.blits(overlays, doreturn=False)
     
     def _render_deck(self):
         """Render the current deck."""
         if not self.current_deck:
             return
         
-        # Calculate the cards on the current page
+        # Cards on the current page
         start_idx = self.deck_page * self.cards_per_page
-        end_idx = min(start_idx + self.cards_per_page, self.current_deck.size())
-        page_cards = self.current_deck.cards[start_idx:end_idx]
+        page_cards = self._current_deck_page_cards
+        
+        # Draw the cards, with their faces blitted in one batch
+        self.card_renderer.render_cards(
+            self.display,
+            [(card, self._deck_slot_rects[i].topleft, (start_idx + i) == self.selected_deck_card)
+             for i, card in enumerate(page_cards)],
+            selectable=True
+        )
+        
+        # Text surfaces drawn over the cards, blitted in one batch
+        overlays = []
         
-        # Draw each card
         for i, card in enumerate(page_cards):
-            card_rect = self._get_deck_card_rect(i)
-            
-            # Draw the card
-            self.card_renderer.render_card(
-                self.display, 
-                card, 
-                (card_rect.left, card_rect.top),
-                selectable=True,
-                selected=(start_idx + i) == self.selected_deck_card
-            )
+            card_rect = self._deck_slot_rects[i]
             
             # Draw "Remove" hint
-            hint_font = pygame.freetype.SysFont('Arial', 10)
-            hint_surf, hint_rect = hint_font.render("Click to remove", (180, 180, 180))
-            hint_rect.centerx = card_rect.centerx
-            hint_rect.bottom = card_rect.bottom - 5
-            self.display.blit(hint_surf, hint_rect)
+            hint_rect = self._remove_hint.get_rect(
+                midbottom=(card_rect.centerx, card_rect.bottom - 5)
+            )
+            overlays.append((self._remove_hint, hint_rect))
             
             # Draw card count indicator (how many of this card in the deck)
-            card_count = sum(1 for c in self.current_deck.cards if c.id == card.id)
+            card_count = self._deck_id_counts[card.id]
             
             count_bg = pygame.Rect(card_rect.right - 25, card_rect.top + 5, 20, 20)
-            pygame.draw.rect(self.display, (50, 50, 70), count_bg, border_radius=10)
-            pygame.draw.rect(self.display, (100, 100, 130), count_bg, width=1, border_radius=10)
+            overlays.append((self._qty_badge, count_bg))
             
-            count_font = pygame.freetype.SysFont('Arial', 14)
-            count_surf, count_rect = count_font.render(f"{card_count}/{Deck.MAX_COPIES_PER_CARD}", (220, 220, 220))
+            count_surf, count_rect = self._get_badge_text(f"{card_count}/{Deck.MAX_COPIES_PER_CARD}")
             count_rect.center = count_bg.center
-            self.display.blit(count_surf, count_rect)
+            overlays.append((count_surf, count_rect))
+        
+        self.display.blits(overlays, doreturn=False)
+    
+    def _create_add_hint(self):
+        """
+        Render the "Click to add" hint onto its padded background.
+        
+        Returns:
+            pygame.Surface: Hint surface with per-pixel alpha
+        """
+        text_surf, text_rect = self._hint_font.render("Click to add", (220, 220, 220))
+        
+        # Semi-transparent background with padding around the text
+        hint = pygame.Surface((text_rect.width + 10, text_rect.height + 6), pygame.SRCALPHA)
+        hint.fill((40, 45, 60, 180))
+        pygame.draw.rect(hint, (80, 90, 120, 200), hint.get_rect(), width=1, border_radius=3)
+        
+        text_rect.center = hint.get_rect().center
+        hint.blit(text_surf, text_rect)
+        return hint
+    
+    def _get_badge_text(self, text):
+        """
+        Get the rendered text for a card badge, rendering it on first use.
+        
+        Args:
+            text (str): Badge text
+            
+        Returns:
+            tuple: (surface, rect) with a fresh rect the caller can position
+        """
+        cached = self._qty_surf_cache.get(text)
+        if cached is None:
+            cached = self._qty_font.render(text, (220, 220, 220))
+            self._qty_surf_cache[text] = cached
+        
+        surf, rect = cached
+        return surf, rect.copy()
     
     def load_resources(self):
         """Load screen-specific resources."""
@@ -1493,6 +1647,10 @@ class DeckBuildingScreen(Screen):
             self.resources["background"] = pygame.transform.scale(
                 self.resources["background"], (self.width, self.height)
             )
+            
+            # The background is opaque, so a plain convert is enough
+            if pygame.display.get_surface() is not None:
+                self.resources["background"] = self.resources["background"].convert()
         except (pygame.error, FileNotFoundError):
             # No specific handling needed, we'll use the solid color background
             pass
\ No newline at end of file
@@ -53,6 +53,10 @@ class GameScreen(Screen):
         self.game_log = []  # Store recent game events for display
         self.card_animations = []  # Store active card animations
         
+        # Game log font, and the rendered lines of each log message
+        self._log_font = pygame.freetype.SysFont('Arial', 12)
+        self._log_line_surfs = {}
+        
         # Card renderer
         self.card_renderer = CardRenderer(card_size=(100, 150))
         
@@ -61,6 +65,15 @@ class GameScreen(Screen):
         self.hand_y = self.height - 170
         self.player_field_y = self.height - 340
         self.opponent_field_y = 140
+        self._field_xs = self._get_field_card_xs()
+        
+        # Hand layout from _get_hand_layout and the (hand size, card width) it is for
+        self._hand_layout = None
+        self._hand_layout_key = None
+        
+        # Background with the field outlines and connection lines, built on
+        # the first render
+        self._static_layer = None
         
         # Create UI elements
         self._create_ui_elements()
@@ -358,9 +371,12 @@ class GameScreen(Screen):
         player.draw_starting_hand(PLAYER_STARTING_HAND_SIZE)
         opponent.draw_starting_hand(PLAYER_STARTING_HAND_SIZE)
         
-        # Load card images
-        for card_id, card in card_database.items():
-            self.card_renderer.load_card_image(card_id, card.image_path)
+        # Compose the faces of every card either side can play; other cards
+        # in the database are never shown during a game
+        self.card_renderer.prepare_card_faces(
+            {card.id: card for card in (player.hand + player.deck.cards
+                                        + opponent.hand + opponent.deck.cards)}.values()
+        )
         
         # Clear game log
         self.game_log = ["Game started", f"Opponent: {opponent.name}", "Draw your cards"]
@@ -500,32 +516,22 @@ class GameScreen(Screen):
             # Handle card selection from hand
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # Check if clicked on a card in hand
-                for i, card in enumerate(self.game_state.player.hand):
-                    card_x = self._get_hand_card_x(i)
-                    card_rect = pygame.Rect(card_x, self.hand_y, 
-                                         self.card_renderer.card_size[0], 
-                                         self.card_renderer.card_size[1])
-                    
-                    if card_rect.collidepoint(event.pos):
-                        # Select this card if it's playable
-                        if card.cost <= self.game_state.player.energy:
-                            self.selected_card_index = i
-                        return True
+                i = self._hand_index_at(event.pos)
+                if i is not None:
+                    # Select this card if it's playable
+                    if self.game_state.player.hand[i].cost <= self.game_state.player.energy:
+                        self.selected_card_index = i
+                    return True
                 
                 # Check if clicked on a field position
                 if self.selected_card_index is not None:
-                    for i in range(PLAYER_FIELD_SIZE):
-                        field_x = self._get_field_card_x(i)
-                        field_rect = pygame.Rect(field_x, self.player_field_y, 
-                                             self.card_renderer.card_size[0], 
-                                             self.card_renderer.card_size[1])
-                        
-                        if field_rect.collidepoint(event.pos):
-                            # Try to play the card here
-                            if self.game_state.player.field[i] is None:
-                                self._play_card_to_field(self.selected_card_index, i)
-                            self.selected_card_index = None
-                            return True
+                    i = self._field_index_at(event.pos)
+                    if i is not None:
+                        # Try to play the card here
+                        if self.game_state.player.is_slot_free(i):
+                            self._play_card_to_field(self.selected_card_index, i)
+                        self.selected_card_index = None
+                        return True
             
             # Clear selection on right click
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
@@ -543,58 +549,45 @@ class GameScreen(Screen):
         """
         super().update(dt)
         
+        # Process the current phase unless it is waiting for player input
+        self._advance_automatic_phase()
+        
+        # Update animations, if any are running
+        if self.card_animations:
+            self._update_animations(dt)
+    
+    def _advance_automatic_phase(self):
+        """
+        Process the current phase if it does not wait for player input.
+        
+        Returns:
+            bool: True if a phase was processed, False otherwise
+        """
+        if self.game_state.game_over:
+            return False
+        
         # If AI's turn, let it play
-        if not self.game_state.game_over and self.game_state.current_player == self.game_state.opponent:
-            # Process the turn based on current phase
-            if self.game_state.current_phase == GamePhase.DRAW:
-                events = self.game_controller.process_turn()
-                self._handle_game_events(events)
-                self.game_controller.advance_phase()
-                self._update_ui_from_game_state()
-                
-            elif self.game_state.current_phase == GamePhase.PLAY:
+        if self.game_state.current_player == self.game_state.opponent:
+            if self.game_state.current_phase == GamePhase.PLAY:
                 # Let AI make its play decisions
                 ai_results = self.ai_controller.take_turn()
                 self._handle_game_events({"events": ai_results["events"]})
-                
-                # AI automatically ends its play phase
-                self.game_controller.advance_phase()
-                self._update_ui_from_game_state()
-                
-            elif self.game_state.current_phase == GamePhase.ATTACK:
-                events = self.game_controller.process_turn()
-                self._handle_game_events(events)
-                self.game_controller.advance_phase()
-                self._update_ui_from_game_state()
-                
-            elif self.game_state.current_phase == GamePhase.END:
+            else:
+                # Draw, attack and end phases run through the game controller
                 events = self.game_controller.process_turn()
                 self._handle_game_events(events)
-                self.game_controller.advance_phase()
-                self._update_ui_from_game_state()
         
         # If it's player's turn but not play phase, auto-progress
-        elif not self.game_state.game_over and self.game_state.current_player == self.game_state.player:
-            if self.game_state.current_phase == GamePhase.DRAW:
-                events = self.game_controller.process_turn()
-                self._handle_game_events(events)
-                self.game_controller.advance_phase()
-                self._update_ui_from_game_state()
-                
-            elif self.game_state.current_phase == GamePhase.ATTACK:
-                events = self.game_controller.process_turn()
-                self._handle_game_events(events)
-                self.game_controller.advance_phase()
-                self._update_ui_from_game_state()
-                
-            elif self.game_state.current_phase == GamePhase.END:
-                events = self.game_controller.process_turn()
-                self._handle_game_events(events)
-                self.game_controller.advance_phase()
-                self._update_ui_from_game_state()
-                
-        # Update animations
-        self._update_animations(dt)
+        elif self.game_state.current_phase != GamePhase.PLAY:
+            events = self.game_controller.process_turn()
+            self._handle_game_events(events)
+        
+        else:
+            return False
+        
+        self.game_controller.advance_phase()
+        self._update_ui_from_game_state()
+        return True
     
     def _update_animations(self, dt):
         """Update card animations."""
@@ -662,34 +655,95 @@ class GameScreen(Screen):
         if len(self.game_log) > 10:
             self.game_log = self.game_log[-10:]
     
-    def _get_hand_card_x(self, index):
+    def _get_hand_layout(self):
+        """
+        Get the positions of the cards in hand, as drawn by _render_hand.
+        
+        The layout only depends on the hand size and card width, so it is
+        cached until either changes.
+        
+        Returns:
+            tuple: (start_x, spacing, x-coordinate of each card in hand)
+        """
+        num_cards = len(self.game_state.player.hand)
+        card_width = self.card_renderer.card_size[0]
+        layout_key = (num_cards, card_width)
+        if self._hand_layout_key == layout_key:
+            return self._hand_layout
+        
+        # Calculate card spacing based on number of cards
+        max_width = self.width - 300  # Reserve space on edges
+        
+        # Overlap cards if too many to fit
+        if num_cards * card_width > max_width:
+            spacing = max_width / num_cards
+        else:
+            spacing = card_width + self.card_margin
+        
+        # Calculate starting position to center the hand
+        start_x = (self.width - (spacing * (num_cards - 1) + card_width)) // 2
+        
+        self._hand_layout = (start_x, spacing, tuple(int(start_x + i * spacing) for i in range(num_cards)))
+        self._hand_layout_key = layout_key
+        return self._hand_layout
+    
+    def _hand_index_at(self, pos):
         """
-        Calculate the x-coordinate for a card in hand.
+        Find the card in hand under a point.
+        
+        Where cards overlap, the later card is drawn on top and wins.
         
         Args:
-            index (int): Index of the card in hand
+            pos (tuple): Screen position (x, y)
             
         Returns:
-            int: X-coordinate for the card
+            Optional[int]: Index of the card in hand, or None if there is none
         """
-        hand_size = len(self.game_state.player.hand)
-        total_width = hand_size * (self.card_renderer.card_size[0] + self.card_margin) - self.card_margin
-        start_x = (self.width - 220) // 2 - total_width // 2
-        return start_x + index * (self.card_renderer.card_size[0] + self.card_margin)
+        card_width, card_height = self.card_renderer.card_size
+        if not self.hand_y <= pos[1] < self.hand_y + card_height:
+            return None
+        
+        start_x, spacing, hand_xs = self._get_hand_layout()
+        offset = pos[0] - start_x
+        if not hand_xs or offset < 0:
+            return None
+        
+        index = min(int(offset // spacing), len(hand_xs) - 1)
+        if pos[0] < hand_xs[index] + card_width:
+            return index
+        return None
     
-    def _get_field_card_x(self, index):
+    def _field_index_at(self, pos):
         """
-        Calculate the x-coordinate for a card on the field.
+        Find the player's field position under a point.
         
         Args:
-            index (int): Index of the field position
+            pos (tuple): Screen position (x, y)
             
         Returns:
-            int: X-coordinate for the card
+            Optional[int]: Index of the field position, or None if there is none
+        """
+        card_width, card_height = self.card_renderer.card_size
+        if not self.player_field_y <= pos[1] < self.player_field_y + card_height:
+            return None
+        
+        # Field positions are evenly spaced, with card_margin gaps between them
+        index, x = divmod(pos[0] - self._field_xs[0], card_width + self.card_margin)
+        if 0 <= index < PLAYER_FIELD_SIZE and x < card_width:
+            return index
+        return None
+    
+    def _get_field_card_xs(self):
+        """
+        Calculate the x-coordinate of each field position.
+        
+        Returns:
+            tuple: X-coordinate for each of the PLAYER_FIELD_SIZE positions
         """
-        total_width = PLAYER_FIELD_SIZE * (self.card_renderer.card_size[0] + self.card_margin) - self.card_margin
+        stride = self.card_renderer.card_size[0] + self.card_margin
+        total_width = PLAYER_FIELD_SIZE * stride - self.card_margin
         start_x = (self.width - 220) // 2 - total_width // 2
-        return start_x + index * (self.card_renderer.card_size[0] + self.card_margin)
+        return tuple(start_x + index * stride for index in range(PLAYER_FIELD_SIZE))
     
     def _play_card_to_field(self, hand_index, field_index):
         """
@@ -783,14 +837,16 @@ class GameScreen(Screen):
                     40 + int(y / self.height * 15)
                 )
                 pygame.draw.line(self.resources["background"], color, (0, y), (self.width, y))
+        
+        # Rebuild the static board layer from the new background
+        self._static_layer = None
     
     def render(self):
         """Render the game screen."""
-        # Draw background
-        if "background" in self.resources:
-            self.display.blit(self.resources["background"], (0, 0))
-        else:
-            self.display.fill(self.background_color)
+        # Draw background, empty field outlines and connection lines from the cached layer
+        if self._static_layer is None:
+            self._static_layer = self._create_static_layer()
+        self.display.blit(self._static_layer, (0, 0))
         
         # Draw the game board
         self._render_game_board()
@@ -805,57 +861,34 @@ class GameScreen(Screen):
         # Render game log in the game panel (right side panel)
         self._render_game_log()
     
-    def _render_game_board(self):
-        """Render the game board including player and opponent fields."""
-        if not self.game_state:
-            return
+    def _create_static_layer(self):
+        """
+        Draw the parts of the board that never change onto one surface.
         
-        # Draw field positions for player
-        for i in range(PLAYER_FIELD_SIZE):
-            x = self._get_field_card_x(i)
-            
-            # Draw field position outline
-            field_rect = pygame.Rect(x, self.player_field_y, 
-                                   self.card_renderer.card_size[0], 
-                                   self.card_renderer.card_size[1])
-            
-            # Different color if a card can be played here
-            if (self.selected_card_index is not None and 
-                self.game_state.current_phase == GamePhase.PLAY and
-                self.game_state.current_player == self.game_state.player and
-                self.game_state.player.field[i] is None):
-                pygame.draw.rect(self.display, (100, 100, 150), field_rect, width=2, border_radius=5)
-            else:
-                pygame.draw.rect(self.display, (80, 80, 80), field_rect, width=1, border_radius=5)
-            
-            # Draw card if one is present
-            if self.game_state.player.field[i]:
-                card = self.game_state.player.field[i]
-                self.card_renderer.render_card(self.display, card, (x, self.player_field_y))
+        Returns:
+            pygame.Surface: Background with the field outlines and connection lines
+        """
+        layer = pygame.Surface(self.display.get_size())
+        if "background" in self.resources:
+            layer.blit(self.resources["background"], (0, 0))
+        else:
+            layer.fill(self.background_color)
+        
+        card_width, card_height = self.card_renderer.card_size
         
-        # Draw field positions for opponent
         for i in range(PLAYER_FIELD_SIZE):
-            x = self._get_field_card_x(i)
+            x = self._field_xs[i]
             
-            # Draw field position outline
-            field_rect = pygame.Rect(x, self.opponent_field_y, 
-                                   self.card_renderer.card_size[0], 
-                                   self.card_renderer.card_size[1])
-            pygame.draw.rect(self.display, (80, 80, 80), field_rect, width=1, border_radius=5)
+            # Draw field position outlines for both players
+            for field_y in (self.player_field_y, self.opponent_field_y):
+                field_rect = pygame.Rect(x, field_y, card_width, card_height)
+                pygame.draw.rect(layer, (80, 80, 80), field_rect, width=1, border_radius=5)
             
-            # Draw card if one is present
-            if self.game_state.opponent.field[i]:
-                card = self.game_state.opponent.field[i]
-                self.card_renderer.render_card(self.display, card, (x, self.opponent_field_y))
-        
-        # Draw battlefield connection lines
-        for i in range(PLAYER_FIELD_SIZE):
-            player_x = self._get_field_card_x(i) + self.card_renderer.card_size[0] // 2
+            # Draw a dashed line connecting the positions
+            line_x = x + card_width // 2
             player_y = self.player_field_y
-            opponent_x = self._get_field_card_x(i) + self.card_renderer.card_size[0] // 2
-            opponent_y = self.opponent_field_y + self.card_renderer.card_size[1]
+            opponent_y = self.opponent_field_y + card_height
             
-            # Draw a dashed line connecting the positions
             dash_length = 5
             gap_length = 5
             distance = opponent_y - player_y
@@ -867,40 +900,62 @@ class GameScreen(Screen):
                 if end_y > opponent_y:
                     end_y = opponent_y
                 
-                pygame.draw.line(self.display, (100, 100, 120), 
-                               (player_x, start_y), (player_x, end_y), 1)
+                pygame.draw.line(layer, (100, 100, 120), 
+                               (line_x, start_y), (line_x, end_y), 1)
+        
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        return layer
     
-    def _render_hand(self):
-        """Render the player's hand with proper scaling and positioning"""
+    def _render_game_board(self):
+        """Render the cards on the player and opponent fields."""
         if not self.game_state:
             return
         
-        hand = self.game_state.player.hand
-        num_cards = len(hand)
+        # Cards on both fields, drawn in one batch after the highlights
+        field_cards = []
         
-        # Calculate card spacing based on number of cards
-        max_width = self.width - 300  # Reserve space on edges
+        # Highlight the empty player positions the selected card can be played to
+        can_place = (self.selected_card_index is not None and 
+                     self.game_state.current_phase == GamePhase.PLAY and
+                     self.game_state.current_player == self.game_state.player)
         
-        if num_cards > 0:
-            # Scale cards if too many to fit
-            if num_cards * self.card_renderer.card_size[0] > max_width:
-                overlap_factor = min(1.0, max_width / (num_cards * self.card_renderer.card_size[0]))
-                spacing = self.card_renderer.card_size[0] * overlap_factor
-            else:
-                spacing = self.card_renderer.card_size[0] + 10
-            
-            # Calculate starting position to center the hand
-            start_x = (self.width - (spacing * (num_cards - 1) + self.card_renderer.card_size[0])) // 2
+        for i in range(PLAYER_FIELD_SIZE):
+            x = self._field_xs[i]
+            card = self.game_state.player.field[i]
             
-            # Render each card
-            for i, card in enumerate(hand):
-                x = start_x + (i * spacing)
-                self.card_renderer.render_card(
-                    self.display, 
-                    card, 
-                    (x, self.hand_y),
-                    selectable=(i == self.selected_card_index)
-                )
+            if card:
+                field_cards.append((card, (x, self.player_field_y), False))
+            elif can_place:
+                field_rect = pygame.Rect(x, self.player_field_y, 
+                                       self.card_renderer.card_size[0], 
+                                       self.card_renderer.card_size[1])
+                pygame.draw.rect(self.display, (100, 100, 150), field_rect, width=2, border_radius=5)
+        
+        for i in range(PLAYER_FIELD_SIZE):
+            card = self.game_state.opponent.field[i]
+            if card:
+                field_cards.append((card, (self._field_xs[i], self.opponent_field_y), False))
+        
+        if field_cards:
+            self.card_renderer.render_cards(self.display, field_cards)
+    
+    def _render_hand(self):
+        """Render the player's hand with proper scaling and positioning"""
+        if not self.game_state:
+            return
+        
+        hand = self.game_state.player.hand
+        hand_xs = self._get_hand_layout()[2]
+        
+        # Render each card
+        for i, card in enumerate(hand):
+            self.card_renderer.render_card(
+                self.display, 
+                card, 
+                (hand_xs[i], self.hand_y),
+                selectable=(i == self.selected_card_index)
+            )
     
     def _render_game_log(self):
         """Render the game log in the game panel."""
@@ -908,27 +963,47 @@ class GameScreen(Screen):
             return
         
         # Log area in the game panel
-        log_rect = pygame.Rect(self.width - 200, 170, 180, 300)
-        log_y = log_rect.y + 10
-        
-        # Draw each log entry
-        font = pygame.freetype.SysFont('Arial', 12)
+        log_x = self.width - 190
+        log_y = 180
         line_height = 20
         
-        for i, message in enumerate(self.game_log):
-            # Skip if too many messages to fit
-            if i >= 10:
-                break
-            
-            # Wrap text to fit in the panel
-            wrapped_text = self._wrap_text(message, font, log_rect.width - 20)
-            
-            for line in wrapped_text:
-                log_surf, log_rect = font.render(line, (200, 200, 200))
-                log_rect.x = self.width - 190
-                log_rect.y = log_y
-                self.display.blit(log_surf, log_rect)
+        # Draw each log entry, skipping any beyond the 10 that fit
+        lines = []
+        for message in self.game_log[:10]:
+            for line_surf in self._get_log_lines(message):
+                lines.append((line_surf, (log_x, log_y)))
                 log_y += line_height
+        
+        self.display.blits(lines, doreturn=False)
+    
+    def _get_log_lines(self, message):
+        """
+        Get the wrapped, rendered lines of a game log message, rendering them on first use.
+        
+        Args:
+            message (str): Game log message
+            
+        Returns:
+            list: Surface for each line of the message
+        """
+        line_surfs = self._log_line_surfs.get(message)
+        if line_surfs is not None:
+            return line_surfs
+        
+        # Forget messages that have scrolled out of the log
+        if len(self._log_line_surfs) >= 20:
+            self._log_line_surfs = {
+                text: surfs for text, surfs in self._log_line_surfs.items()
+                if text in self.game_log
+            }
+        
+        # Wrap text to fit in the 180px wide log area
+        line_surfs = [
+            self._log_font.render(line, (200, 200, 200))[0]
+            for line in self._wrap_text(message, self._log_font, 160)
+        ]
+        self._log_line_surfs[message] = line_surfs
+        return line_surfs
     
     def _wrap_text(self, text, font, max_width):
         """
@@ -3,6 +3,7 @@ Home screen for the card game.
 """
 import pygame
 import os
+from functools import partial
 
 # Fixed imports
 from src.screens.screen import Screen
@@ -197,7 +198,7 @@ class HomeScreen(Screen):
         easy_button = Button(
             pygame.Rect(button_x, 80, button_width, button_height),
             "Easy",
-            lambda: self._start_game("easy"),
+            partial(self._start_game, "easy"),
             color=(60, 120, 60),
             hover_color=(80, 160, 80),
             font_size=20
@@ -207,7 +208,7 @@ class HomeScreen(Screen):
         normal_button = Button(
             pygame.Rect(button_x, 130, button_width, button_height),
             "Normal",
-            lambda: self._start_game("normal"),
+            partial(self._start_game, "normal"),
             color=(120, 120, 60),
             hover_color=(160, 160, 80),
             font_size=20
@@ -217,7 +218,7 @@ class HomeScreen(Screen):
         hard_button = Button(
             pygame.Rect(button_x, 180, button_width, button_height),
             "Hard",
-            lambda: self._start_game("hard"),
+            partial(self._start_game, "hard"),
             color=(120, 60, 60),
             hover_color=(160, 80, 80),
             font_size=20
@@ -372,7 +373,7 @@ class HomeScreen(Screen):
         continue_button = Button(
             pygame.Rect(150, 140, 100, 30),
             "Continue",
-            lambda: self._continue_to_game(difficulty),
+            partial(self._continue_to_game, difficulty),
             color=(60, 120, 60),
             hover_color=(80, 160, 80),
             font_size=16
@@ -3,6 +3,8 @@ UI elements for the card game.
 """
 import pygame
 import pygame.freetype
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # No relative imports to fix in this file
 
@@ -24,7 +26,7 @@ class Button:
     
     def __init__(self, rect, text, callback, color=(100, 100, 100), 
                  hover_color=(150, 150, 150), text_color=(255, 255, 255),
-                 font_size=20, enabled=True):
+                 font_size=20, enabled=True, font=None):
         """
         Initialize a new button.
         
@@ -37,6 +39,7 @@ class Button:
             text_color (tuple): RGB color of the text
             font_size (int): Size of the font
             enabled (bool): Whether the button is enabled
+            font (pygame.freetype.Font): Shared font to use instead of loading one
         """
         self.rect = pygame.Rect(rect)
         self.text = text
@@ -48,11 +51,15 @@ class Button:
         self.enabled = enabled
         
         # Initialize font
-        self.font = pygame.freetype.SysFont('Arial', self.font_size)
+        self.font = font if font is not None else pygame.freetype.SysFont('Arial', self.font_size)
         
         # State
         self.hovered = False
         self.pressed = False
+        
+        # Last rendered text, reused until the text or its color changes
+        self._text_render = None
+        self._text_render_key = None
     
     def handle_event(self, event):
         """
@@ -126,7 +133,12 @@ class Button:
         pygame.draw.rect(surface, border_color, self.rect, width=2, border_radius=5)
         
         # Render text
-        text_surface, text_rect = self.font.render(self.text, self.text_color)
+        text_key = (self.text, self.text_color)
+        if self._text_render_key != text_key:
+            self._text_render = self.font.render(self.text, self.text_color)
+            self._text_render_key = text_key
+        text_surface, text_rect = self._text_render
+        text_rect = text_rect.copy()
         text_rect.center = self.rect.center
         surface.blit(text_surface, text_rect)
 
@@ -162,6 +174,10 @@ class Label:
         
         # Initialize font
         self.font = pygame.freetype.SysFont('Arial', self.font_size)
+        
+        # Last rendered text, reused until the text or its color changes
+        self._text_render = None
+        self._text_render_key = None
     
     def set_text(self, text):
         """
@@ -180,7 +196,12 @@ class Label:
             surface (pygame.Surface): Surface to render on
         """
         # Render text
-        text_surface, text_rect = self.font.render(self.text, self.color)
+        text_key = (self.text, self.color)
+        if self._text_render_key != text_key:
+            self._text_render = self.font.render(self.text, self.color)
+            self._text_render_key = text_key
+        text_surface, text_rect = self._text_render
+        text_rect = text_rect.copy()
         
         # Position based on alignment
         if self.align == 'left':
@@ -226,6 +247,10 @@ class Panel:
         # UI elements in the panel
         self.elements = []
         
+        # Area covered by the panel and its elements, used to skip mouse
+        # events that cannot reach any of them
+        self.bounding_rect = self.rect.copy()
+        
         # Create surface for semi-transparent panels
         self.has_alpha = len(self.color) == 4 and self.color[3] < 255
         if self.has_alpha:
@@ -239,6 +264,8 @@ class Panel:
             element: UI element to add
         """
         self.elements.append(element)
+        if hasattr(element, 'rect'):
+            self.bounding_rect.union_ip(element.rect)
     
     def handle_event(self, event):
         """
@@ -250,6 +277,13 @@ class Panel:
         Returns:
             bool: True if the event was handled, False otherwise
         """
+        # Presses and motion away from every element can be ignored; buttons
+        # still see releases so they can clear their pressed state, and
+        # update() refreshes their hover state each frame
+        if (event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+                and not self.bounding_rect.collidepoint(event.pos)):
+            return False
+        
         # Pass the event to contained elements
         for element in self.elements:
             if hasattr(element, 'handle_event') and element.handle_event(event):
@@ -412,17 +446,35 @@ class CardRenderer:
         default_image: Default image to use when a specific card image is not available
     """
     
-    def __init__(self, card_size=(120, 180)):
+    def __init__(self, card_size=(120, 180), max_images=None):
         """
         Initialize the card renderer.
         
         Args:
             card_size (tuple): Width and height of cards
+            max_images (int, optional): Number of cards whose image and faces
+                are kept in memory, least recently drawn dropped first.
+                Defaults to None, which keeps every card.
         """
         self.card_size = card_size
         self.card_images = {}
         self.default_image = None
         
+        # Card ids in least to most recently drawn order, when bounded
+        self.max_images = max_images
+        self._recent_ids = OrderedDict()
+        
+        # Card ids whose image failed to load, so they are not retried every frame
+        self._missing_images = set()
+        
+        # Images being decoded in the background: card id -> (path, future)
+        self._pending_images = {}
+        self._image_executor = None
+        
+        # Pre-drawn card faces (everything but the border), keyed by
+        # (card id, cost, attack, hp) so damaged cards get their own face
+        self._composed = {}
+        
         # Font for card text
         self.name_font = pygame.freetype.SysFont('Arial', 14)
         self.stats_font = pygame.freetype.SysFont('Arial', 16, bold=True)
@@ -449,16 +501,192 @@ class CardRenderer:
             image_path (str): Path to the image file
         """
         try:
-            image = pygame.image.load(image_path)
-            image = pygame.transform.scale(image, self.card_size)
-            self.card_images[card_id] = image
-        except pygame.error:
-            print(f"Warning: Could not load image for card {card_id}: {image_path}")
+            self._store_card_image(card_id, pygame.image.load(image_path))
+        except (pygame.error, FileNotFoundError):
+            self._image_failed(card_id, image_path)
+    
+    def prefetch_card_images(self, cards):
+        """
+        Start decoding card images on a worker thread.
+        
+        Images are scaled and converted on the main thread by render_card
+        once decoding finishes; until then the card shows a placeholder.
+        Each call replaces the previous prefetch: pending images for cards
+        not passed in are cancelled or dropped, so callers should include
+        any visible cards that may still be decoding.
+        
+        Args:
+            cards: Iterable of Card objects
+        """
+        cards = {card.id: card for card in cards}
+        
+        # Forget prefetches the caller no longer wants, decoded or not
+        for card_id in [card_id for card_id in self._pending_images if card_id not in cards]:
+            self._pending_images.pop(card_id)[1].cancel()
+        
+        if self._image_executor is None:
+            self._image_executor = ThreadPoolExecutor(max_workers=2)
+        
+        for card_id, card in cards.items():
+            if (card_id in self.card_images or card_id in self._missing_images
+                    or card_id in self._pending_images):
+                continue
+            
+            # Pending images count against the same limit as loaded ones
+            if self.max_images is not None and len(self._pending_images) >= self.max_images:
+                break
             
-            # If no default image exists, create one
-            if self.default_image is None:
-                self.default_image = pygame.Surface(self.card_size)
-                self.default_image.fill((70, 70, 70))
+            future = self._image_executor.submit(pygame.image.load, card.image_path)
+            self._pending_images[card_id] = (card.image_path, future)
+    
+    def close(self):
+        """
+        Drop pending prefetches and shut down the image decoding worker.
+        
+        The renderer stays usable; a later prefetch starts a new worker.
+        """
+        for _, future in self._pending_images.values():
+            future.cancel()
+        self._pending_images.clear()
+        
+        if self._image_executor is not None:
+            self._image_executor.shutdown(wait=False, cancel_futures=True)
+            self._image_executor = None
+    
+    def _finish_pending_image(self, card_id):
+        """
+        Store a prefetched image if its worker has finished decoding it.
+        
+        Args:
+            card_id (str): ID of the card
+        """
+        image_path, future = self._pending_images[card_id]
+        if not future.done():
+            return
+        
+        del self._pending_images[card_id]
+        try:
+            self._store_card_image(card_id, future.result())
+        except (pygame.error, FileNotFoundError):
+            self._image_failed(card_id, image_path)
+    
+    def _store_card_image(self, card_id, image):
+        """
+        Scale a decoded card image and make it available for rendering.
+        
+        Args:
+            card_id (str): ID of the card
+            image (pygame.Surface): Decoded image
+        """
+        image = pygame.transform.scale(image, self.card_size)
+        
+        # Match the display's pixel format so blits skip per-pixel conversion
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        
+        self.card_images[card_id] = image
+        self._missing_images.discard(card_id)
+        self._drop_composed(card_id)
+    
+    def _image_failed(self, card_id, image_path):
+        """
+        Record a card image that could not be loaded.
+        
+        Args:
+            card_id (str): ID of the card
+            image_path (str): Path to the image file
+        """
+        print(f"Warning: Could not load image for card {card_id}: {image_path}")
+        self._missing_images.add(card_id)
+        
+        # If no default image exists, create one
+        if self.default_image is None:
+            self.default_image = pygame.Surface(self.card_size)
+            self.default_image.fill((70, 70, 70))
+            self._composed.clear()
+    
+    def _drop_composed(self, card_id):
+        """
+        Forget the cached faces of a card so they are redrawn.
+        
+        Args:
+            card_id (str): ID of the card
+        """
+        stale = [key for key in self._composed if key[0] == card_id]
+        for key in stale:
+            del self._composed[key]
+    
+    def _compose_card_face(self, card):
+        """
+        Draw the static parts of a card face onto a new surface.
+        
+        Args:
+            card: Card object to draw
+        
+        Returns:
+            pygame.Surface: Card-sized surface with everything but the border
+        """
+        face = pygame.Surface(self.card_size, pygame.SRCALPHA)
+        card_rect = face.get_rect()
+        
+        # Draw card background
+        pygame.draw.rect(face, self.bg_color, card_rect, border_radius=5)
+        
+        # Draw card image if available
+        if card.id in self.card_images:
+            image = self.card_images[card.id]
+            face.blit(image, (card_rect.left + 5, card_rect.top + 25))
+        elif self.default_image:
+            face.blit(self.default_image, (card_rect.left + 5, card_rect.top + 25))
+        else:
+            # Draw a placeholder
+            img_rect = pygame.Rect(card_rect.left + 5, card_rect.top + 25, 
+                                card_rect.width - 10, card_rect.height - 70)
+            pygame.draw.rect(face, (60, 60, 60), img_rect, border_radius=3)
+            
+            # Draw card name as placeholder
+            name_surf, name_rect = self.name_font.render(card.name, (200, 200, 200))
+            name_rect.center = img_rect.center
+            face.blit(name_surf, name_rect)
+        
+        # Draw card name
+        name_surf, name_rect = self.name_font.render(card.name, (255, 255, 255))
+        name_rect.midtop = (card_rect.centerx, card_rect.top + 5)
+        face.blit(name_surf, name_rect)
+        
+        # Draw card stats
+        # Cost (top left)
+        cost_bg = pygame.Rect(card_rect.left + 5, card_rect.top + 5, 20, 20)
+        pygame.draw.rect(face, (50, 50, 150), cost_bg, border_radius=10)
+        pygame.draw.rect(face, (100, 100, 200), cost_bg, width=1, border_radius=10)
+        
+        cost_surf, cost_rect = self.stats_font.render(str(card.cost), (255, 255, 255))
+        cost_rect.center = cost_bg.center
+        face.blit(cost_surf, cost_rect)
+        
+        # Attack (bottom left)
+        attack_bg = pygame.Rect(card_rect.left + 5, card_rect.bottom - 25, 20, 20)
+        pygame.draw.rect(face, (150, 50, 50), attack_bg, border_radius=10)
+        pygame.draw.rect(face, (200, 100, 100), attack_bg, width=1, border_radius=10)
+        
+        attack_surf, attack_rect = self.stats_font.render(str(card.attack), (255, 255, 255))
+        attack_rect.center = attack_bg.center
+        face.blit(attack_surf, attack_rect)
+        
+        # Health (bottom right)
+        health_bg = pygame.Rect(card_rect.right - 25, card_rect.bottom - 25, 20, 20)
+        pygame.draw.rect(face, (50, 150, 50), health_bg, border_radius=10)
+        pygame.draw.rect(face, (100, 200, 100), health_bg, width=1, border_radius=10)
+        
+        health_surf, health_rect = self.stats_font.render(str(card.hp), (255, 255, 255))
+        health_rect.center = health_bg.center
+        face.blit(health_surf, health_rect)
+        
+        # Draw rarity indicator
+        rarity_color = self.rarity_colors.get(card.rarity, (150, 150, 150))
+        pygame.draw.rect(face, rarity_color, (card_rect.right - 25, card_rect.top + 5, 20, 5), border_radius=2)
+        
+        return face
     
     def render_card(self, surface, card, position, face_up=True, selectable=False, selected=False):
         """
@@ -492,6 +720,105 @@ class CardRenderer:
             return card_rect
         
         # Render card front
+        surface.blit(self._get_card_face(card), card_rect)
+        self._draw_card_border(surface, card, card_rect, selectable, selected)
+        
+        return card_rect
+    
+    def render_cards(self, surface, placements, selectable=False):
+        """
+        Render several face-up cards, blitting all of their faces in one call.
+        
+        Args:
+            surface (pygame.Surface): Surface to render on
+            placements: Sequence of (card, position, selected) tuples
+            selectable (bool): Whether the cards are selectable
+        
+        Returns:
+            list: Rectangle containing each card, in placement order
+        """
+        width, height = self.card_size
+        card_rects = [pygame.Rect(position[0], position[1], width, height)
+                      for _, position, _ in placements]
+        
+        surface.blits(
+            [(self._get_card_face(card), card_rect)
+             for (card, _, _), card_rect in zip(placements, card_rects)],
+            doreturn=False
+        )
+        
+        # Borders pulse and follow selection, so they are drawn per card
+        for (card, _, selected), card_rect in zip(placements, card_rects):
+            self._draw_card_border(surface, card, card_rect, selectable, selected)
+        
+        return card_rects
+    
+    def prepare_card_faces(self, cards):
+        """
+        Load and compose the faces of cards ahead of their first render.
+        
+        Args:
+            cards: Iterable of Card objects
+        """
+        for card in cards:
+            self._get_card_face(card)
+    
+    def _get_card_face(self, card):
+        """
+        Get the cached face of a card, loading its image and composing it on first use.
+        
+        Args:
+            card: Card object to draw
+        
+        Returns:
+            pygame.Surface: Card-sized surface with everything but the border
+        """
+        if self.max_images is not None:
+            self._touch_card(card.id)
+        
+        # Pick up a prefetched image, or load the card's image the first time it is shown
+        if card.id in self._pending_images:
+            self._finish_pending_image(card.id)
+        elif card.id not in self.card_images and card.id not in self._missing_images:
+            self.load_card_image(card.id, card.image_path)
+        
+        face_key = (card.id, card.cost, card.attack, card.hp)
+        face = self._composed.get(face_key)
+        if face is None:
+            face = self._compose_card_face(card)
+            self._composed[face_key] = face
+        return face
+    
+    def _touch_card(self, card_id):
+        """
+        Mark a card as just drawn, dropping the least recently drawn card's
+        image and faces if over the max_images limit.
+        
+        Args:
+            card_id (str): ID of the card
+        """
+        recent_ids = self._recent_ids
+        if card_id in recent_ids:
+            recent_ids.move_to_end(card_id)
+            return
+        
+        recent_ids[card_id] = None
+        if len(recent_ids) > self.max_images:
+            old_id, _ = recent_ids.popitem(last=False)
+            self.card_images.pop(old_id, None)
+            self._drop_composed(old_id)
+    
+    def _draw_card_border(self, surface, card, card_rect, selectable, selected):
+        """
+        Draw a card's border and selection glow.
+        
+        Args:
+            surface (pygame.Surface): Surface to render on
+            card: Card object being drawn
+            card_rect (pygame.Rect): Rectangle of the card
+            selectable (bool): Whether the card is selectable
+            selected (bool): Whether the card is selected
+        """
         # Get border color based on rarity
         border_color = self.rarity_colors.get(card.rarity, (150, 150, 150))
         
@@ -511,67 +838,10 @@ class CardRenderer:
             b = int(border_color[2] * (1 - pulse) + 255 * pulse)
             border_color = (r, g, b)
         
-        # Draw card background
-        pygame.draw.rect(surface, self.bg_color, card_rect, border_radius=5)
-        
-        # Draw border
+        # Draw border; it changes with selection and pulses, so it is not cached
         border_width = 3 if selected or selectable else 2
         pygame.draw.rect(surface, border_color, card_rect, width=border_width, border_radius=5)
         
-        # Draw card image if available
-        if card.id in self.card_images:
-            image = self.card_images[card.id]
-            surface.blit(image, (card_rect.left + 5, card_rect.top + 25))
-        elif self.default_image:
-            surface.blit(self.default_image, (card_rect.left + 5, card_rect.top + 25))
-        else:
-            # Draw a placeholder
-            img_rect = pygame.Rect(card_rect.left + 5, card_rect.top + 25, 
-                                card_rect.width - 10, card_rect.height - 70)
-            pygame.draw.rect(surface, (60, 60, 60), img_rect, border_radius=3)
-            
-            # Draw card name as placeholder
-            name_surf, name_rect = self.name_font.render(card.name, (200, 200, 200))
-            name_rect.center = img_rect.center
-            surface.blit(name_surf, name_rect)
-        
-        # Draw card name
-        name_surf, name_rect = self.name_font.render(card.name, (255, 255, 255))
-        name_rect.midtop = (card_rect.centerx, card_rect.top + 5)
-        surface.blit(name_surf, name_rect)
-        
-        # Draw card stats
-        # Cost (top left)
-        cost_bg = pygame.Rect(card_rect.left + 5, card_rect.top + 5, 20, 20)
-        pygame.draw.rect(surface, (50, 50, 150), cost_bg, border_radius=10)
-        pygame.draw.rect(surface, (100, 100, 200), cost_bg, width=1, border_radius=10)
-        
-        cost_surf, cost_rect = self.stats_font.render(str(card.cost), (255, 255, 255))
-        cost_rect.center = cost_bg.center
-        surface.blit(cost_surf, cost_rect)
-        
-        # Attack (bottom left)
-        attack_bg = pygame.Rect(card_rect.left + 5, card_rect.bottom - 25, 20, 20)
-        pygame.draw.rect(surface, (150, 50, 50), attack_bg, border_radius=10)
-        pygame.draw.rect(surface, (200, 100, 100), attack_bg, width=1, border_radius=10)
-        
-        attack_surf, attack_rect = self.stats_font.render(str(card.attack), (255, 255, 255))
-        attack_rect.center = attack_bg.center
-        surface.blit(attack_surf, attack_rect)
-        
-        # Health (bottom right)
-        health_bg = pygame.Rect(card_rect.right - 25, card_rect.bottom - 25, 20, 20)
-        pygame.draw.rect(surface, (50, 150, 50), health_bg, border_radius=10)
-        pygame.draw.rect(surface, (100, 200, 100), health_bg, width=1, border_radius=10)
-        
-        health_surf, health_rect = self.stats_font.render(str(card.hp), (255, 255, 255))
-        health_rect.center = health_bg.center
-        surface.blit(health_surf, health_rect)
-        
-        # Draw rarity indicator
-        rarity_color = self.rarity_colors.get(card.rarity, (150, 150, 150))
-        pygame.draw.rect(surface, rarity_color, (card_rect.right - 25, card_rect.top + 5, 20, 5), border_radius=2)
-        
         # Draw selection border with glow effect
         if selected:
             # Create highlight effect
@@ -598,8 +868,6 @@ class CardRenderer:
             # Draw border
             pygame.draw.rect(surface, (255, 215, 0), highlight_rect, 
                            width=2, border_radius=5)
-        
-        return card_rect
 
 
 class UILayout:
@@ -116,9 +116,12 @@ class ResourceLoader:
             # Ensure directory exists
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
-            # Write to file
-            with open(file_path, 'w') as file:
+            # Write to a temporary file and swap it in, so readers never
+            # see a partly written file
+            temp_path = f"{file_path}.tmp"
+            with open(temp_path, 'w') as file:
                 json.dump(data, file, indent=2)
+            os.replace(temp_path, file_path)
             
             return True
         except Exception as e:
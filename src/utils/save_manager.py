@@ -2,12 +2,24 @@
 Utility for saving and loading player progress.
 """
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict
 from ..models.player import Player
 from ..models.card import Card
 from .resource_loader import ResourceLoader
 from ..constants import PLAYER_DATA_PATH
 
+# Background writer for save_player_async; one worker keeps saves in order
+_save_executor = ThreadPoolExecutor(max_workers=1)
+
+# Serializes access to the player file between the main thread and the writer
+_save_lock = threading.Lock()
+
+# Most recently queued background save; the single worker runs saves in
+# order, so once it is done every earlier one is too
+_last_save: Optional[Future] = None
+
 
 class SaveManager:
     """
@@ -26,7 +38,34 @@ class SaveManager:
             bool: True if successful, False otherwise
         """
         player_data = player.to_dict()
-        return ResourceLoader.save_json(player_data, PLAYER_DATA_PATH)
+        with _save_lock:
+            return ResourceLoader.save_json(player_data, PLAYER_DATA_PATH)
+    
+    @staticmethod
+    def save_player_async(player: Player) -> Future:
+        """
+        Save player data to file on a background thread.
+        
+        The player is snapshotted before returning, so it can be changed
+        straight away without affecting the save.
+        
+        Args:
+            player (Player): Player to save
+            
+        Returns:
+            Future: Resolves to True if successful, False otherwise
+        """
+        global _last_save
+        player_data = player.to_dict()
+        player_data["collection"] = dict(player_data["collection"])
+        _last_save = _save_executor.submit(SaveManager._write_player_data, player_data)
+        return _last_save
+    
+    @staticmethod
+    def _write_player_data(player_data: dict) -> bool:
+        """Write already-serialized player data to the save file."""
+        with _save_lock:
+            return ResourceLoader.save_json(player_data, PLAYER_DATA_PATH)
     
     @staticmethod
     def load_player(card_database: Dict[str, Card]) -> Optional[Player]:
@@ -39,7 +78,9 @@ class SaveManager:
         Returns:
             Optional[Player]: Loaded player or None if error occurs
         """
-        player_data = ResourceLoader.load_json(PLAYER_DATA_PATH)
+        SaveManager._wait_for_saves()
+        with _save_lock:
+            player_data = ResourceLoader.load_json(PLAYER_DATA_PATH)
         
         if player_data:
             try:
@@ -57,4 +98,11 @@ class SaveManager:
         Returns:
             bool: True if player data exists, False otherwise
         """
+        SaveManager._wait_for_saves()
         return os.path.exists(PLAYER_DATA_PATH)
+    
+    @staticmethod
+    def _wait_for_saves() -> None:
+        """Block until queued background saves have been written."""
+        if _last_save is not None:
+            _last_save.result()